@@ -413,6 +413,12 @@ def jira_member(
 def jira_members(
     config: Optional[str] = typer.Option(None, "--config", help="Custom config file path"),
     no_upload: bool = typer.Option(False, "--no-upload", help="Skip uploading to Google Sheets"),
+    parallel_members: int = typer.Option(
+        1,
+        "--parallel-members",
+        metavar="N",
+        help="Generate up to N member reports at the same time",
+    ),
 ):
     """Generate Jira reports for ALL individual team members (excludes team report)."""
     console.print(
@@ -430,6 +436,8 @@ def jira_members(
         args.extend(["--config", config])
     if no_upload:
         args.append("--no-upload")
+    if parallel_members > 1:
+        args.extend(["--parallel-members", str(parallel_members)])
 
     script = "impactlens.scripts.generate_jira_report"
     return_code = run_script(script, args, "Generating Jira reports for all members")
@@ -445,6 +453,12 @@ def jira_members(
 def jira_all(
     config: Optional[str] = typer.Option(None, "--config", help="Custom config file path"),
     no_upload: bool = typer.Option(False, "--no-upload", help="Skip uploading to Google Sheets"),
+    parallel_members: int = typer.Option(
+        1,
+        "--parallel-members",
+        metavar="N",
+        help="Generate up to N member reports at the same time",
+    ),
 ):
     """Generate Jira reports for TEAM + ALL MEMBERS."""
     console.print(
@@ -460,6 +474,8 @@ def jira_all(
         args.extend(["--config", config])
     if no_upload:
         args.append("--no-upload")
+    if parallel_members > 1:
+        args.extend(["--parallel-members", str(parallel_members)])
 
     script = "impactlens.scripts.generate_jira_report"
     return_code = run_script(script, args, "Generating Jira team + members reports")
@@ -793,6 +809,12 @@ def pr_members(
     config: Optional[str] = typer.Option(None, "--config", help="Custom config file path"),
     incremental: bool = typer.Option(False, "--incremental", help="Only fetch new/updated PRs"),
     no_upload: bool = typer.Option(False, "--no-upload", help="Skip uploading to Google Sheets"),
+    parallel_members: int = typer.Option(
+        1,
+        "--parallel-members",
+        metavar="N",
+        help="Generate up to N member reports at the same time",
+    ),
 ):
     """Generate PR reports for ALL individual team members (excludes team report)."""
     console.print(
@@ -812,6 +834,8 @@ def pr_members(
         args.append("--incremental")
     if no_upload:
         args.append("--no-upload")
+    if parallel_members > 1:
+        args.extend(["--parallel-members", str(parallel_members)])
 
     script = "impactlens.scripts.generate_pr_report"
     return_code = run_script(script, args, "Generating PR reports for all members")
@@ -828,6 +852,12 @@ def pr_all(
     config: Optional[str] = typer.Option(None, "--config", help="Custom config file path"),
     incremental: bool = typer.Option(False, "--incremental", help="Only fetch new/updated PRs"),
     no_upload: bool = typer.Option(False, "--no-upload", help="Skip uploading to Google Sheets"),
+    parallel_members: int = typer.Option(
+        1,
+        "--parallel-members",
+        metavar="N",
+        help="Generate up to N member reports at the same time",
+    ),
 ):
     """Generate PR reports for TEAM + ALL MEMBERS."""
     console.print(
@@ -845,6 +875,8 @@ def pr_all(
         args.append("--incremental")
     if no_upload:
         args.append("--no-upload")
+    if parallel_members > 1:
+        args.extend(["--parallel-members", str(parallel_members)])
 
     script = "impactlens.scripts.generate_pr_report"
     return_code = run_script(script, args, "Generating PR team + members reports")
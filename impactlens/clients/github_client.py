@@ -3,9 +3,9 @@ GitHub API client for fetching PR data and metrics.
 """
 
 import os
-import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
+from impactlens.utils.http_utils import create_session, parse_json
 from impactlens.utils.logger import logger
 from impactlens.utils.pr_utils import extract_ai_info_from_commits
 
@@ -14,19 +14,21 @@ class GitHubClient:
     """Client for interacting with GitHub API to fetch PR data."""
 
     # List of bot usernames to exclude from human metrics
-    BOT_USERS = {
-        "coderabbit",
-        "coderabbitai",
-        "coderabbit[bot]",
-        "dependabot",
-        "dependabot[bot]",
-        "renovate",
-        "renovate[bot]",
-        "github-actions",
-        "github-actions[bot]",
-        "red-hat-konflux",
-        "red-hat-konflux[bot]",
-    }
+    BOT_USERS = frozenset(
+        {
+            "coderabbit",
+            "coderabbitai",
+            "coderabbit[bot]",
+            "dependabot",
+            "dependabot[bot]",
+            "renovate",
+            "renovate[bot]",
+            "github-actions",
+            "github-actions[bot]",
+            "red-hat-konflux",
+            "red-hat-konflux[bot]",
+        }
+    )
 
     def __init__(
         self,
@@ -91,6 +93,9 @@ class GitHubClient:
         if not self.is_gitlab:
             self.headers["X-GitHub-Api-Version"] = "2022-11-28"
 
+        # Pooled keep-alive connections shared by all API calls
+        self.session = create_session()
+
         logger.info(
             f"Git client initialized for {self.repo_owner}/{self.repo_name} (URL: {self.base_url})"
         )
@@ -108,7 +113,25 @@ class GitHubClient:
         """
         if not username:
             return False
-        return username.lower() in GitHubClient.BOT_USERS or username.lower().endswith("[bot]")
+        login = username.lower()
+        return login in GitHubClient.BOT_USERS or login.endswith("[bot]")
+
+    def _get_json(self, url: str) -> Any:
+        """
+        GET a single API URL and return the decoded JSON body.
+
+        Args:
+            url: Full API URL
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            requests.HTTPError: If the request fails
+        """
+        response = self.session.get(url, headers=self.headers)
+        response.raise_for_status()
+        return parse_json(response)
 
     def fetch_merged_prs(
         self,
@@ -136,6 +159,10 @@ class GitHubClient:
         all_prs = []
         page = 1
 
+        # Parse date range once (avoid repeated parsing in loop)
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+
         while True:
             params = {
                 "state": "closed",
@@ -146,10 +173,10 @@ class GitHubClient:
             }
 
             logger.debug(f"Fetching PRs page {page}...")
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params)
             response.raise_for_status()
 
-            prs = response.json()
+            prs = parse_json(response)
 
             if not prs:
                 break
@@ -174,8 +201,6 @@ class GitHubClient:
                     continue
 
                 merged_date = datetime.strptime(pr["merged_at"], "%Y-%m-%dT%H:%M:%SZ")
-                start = datetime.strptime(start_date, "%Y-%m-%d")
-                end = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
 
                 if start <= merged_date < end:
                     all_prs.append(pr)
@@ -209,10 +234,7 @@ class GitHubClient:
         """
         url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr_number}"
 
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-
-        return response.json()
+        return self._get_json(url)
 
     def get_pr_commits(self, pr_number: int) -> List[Dict[str, Any]]:
         """
@@ -226,10 +248,7 @@ class GitHubClient:
         """
         url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr_number}/commits"
 
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-
-        return response.json()
+        return self._get_json(url)
 
     def get_pr_reviews(self, pr_number: int) -> List[Dict[str, Any]]:
         """
@@ -243,10 +262,7 @@ class GitHubClient:
         """
         url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr_number}/reviews"
 
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-
-        return response.json()
+        return self._get_json(url)
 
     def get_pr_comments(
         self, pr_number: int, reviews: Optional[List[Dict[str, Any]]] = None
@@ -261,26 +277,17 @@ class GitHubClient:
         Returns:
             Dict with review_comments, issue_comments, and approval_reviews
         """
+        repo_url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}"
+
         # Get review comments (inline comments on code)
-        url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr_number}/comments"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        review_comments = response.json()
+        review_comments = self._get_json(f"{repo_url}/pulls/{pr_number}/comments")
 
         # Get issue comments (general PR discussion)
-        url = (
-            f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/issues/{pr_number}/comments"
-        )
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        issue_comments = response.json()
+        issue_comments = self._get_json(f"{repo_url}/issues/{pr_number}/comments")
 
         # Use provided reviews or fetch if not provided
         if reviews is None:
-            url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr_number}/reviews"
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            reviews = response.json()
+            reviews = self._get_json(f"{repo_url}/pulls/{pr_number}/reviews")
 
         # Identify approval reviews (APPROVED state with minimal or no substantive comment)
         approval_review_ids = set()
@@ -335,6 +342,9 @@ class GitHubClient:
         """
         pr_number = pr["number"]
 
+        # PRs are already analyzed concurrently by the caller (get_pr_metrics),
+        # so the per-PR calls stay sequential to bound requests in flight
+
         # Get full PR details to ensure we have diff statistics
         pr_full = self.get_pr_details(pr_number)
 
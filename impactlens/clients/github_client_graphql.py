@@ -31,19 +31,21 @@ class GitGraphQLClient:
     """
 
     # List of bot usernames to exclude from human metrics
-    BOT_USERS = {
-        "coderabbit",
-        "coderabbitai",
-        "coderabbit[bot]",
-        "dependabot",
-        "dependabot[bot]",
-        "renovate",
-        "renovate[bot]",
-        "github-actions",
-        "github-actions[bot]",
-        "red-hat-konflux",
-        "red-hat-konflux[bot]",
-    }
+    BOT_USERS = frozenset(
+        {
+            "coderabbit",
+            "coderabbitai",
+            "coderabbit[bot]",
+            "dependabot",
+            "dependabot[bot]",
+            "renovate",
+            "renovate[bot]",
+            "github-actions",
+            "github-actions[bot]",
+            "red-hat-konflux",
+            "red-hat-konflux[bot]",
+        }
+    )
 
     def __init__(
         self,
@@ -170,7 +172,8 @@ class GitGraphQLClient:
         """Check if a username belongs to a bot."""
         if not username:
             return False
-        return username.lower() in GitGraphQLClient.BOT_USERS or username.lower().endswith("[bot]")
+        login = username.lower()
+        return login in GitGraphQLClient.BOT_USERS or login.endswith("[bot]")
 
     def _load_cache_index(self) -> Dict[str, Any]:
         """Load cache index from disk."""
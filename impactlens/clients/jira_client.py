@@ -1,15 +1,53 @@
 """Jira API client for fetching issue data."""
 
-import requests
+import hashlib
+import json
 import os
+import time
+from pathlib import Path
+
+import requests
 
+from impactlens.utils.http_utils import create_session, parse_json
 from impactlens.utils.logger import logger
 
+# Issues requested per page. Jira caps oversized pages on its side (fewer issues
+# come back with a nextPageToken), so a large default only saves round trips.
+DEFAULT_BATCH_SIZE = 1000
+
+# Issue fields read by the metrics code; requesting only these keeps pages small
+DEFAULT_FIELDS = (
+    "created",
+    "resolutiondate",
+    "status",
+    "issuetype",
+    "timeoriginalestimate",
+    "timetracking",
+)
+
+
+def _cache_ttl_from_env():
+    """
+    Read the response cache TTL from JIRA_CACHE_TTL.
+
+    Unset or empty disables the cache. A malformed value also disables it, with
+    a warning, rather than failing every command that creates a client.
+    """
+    value = os.getenv("JIRA_CACHE_TTL", "").strip()
+    if not value:
+        return 0
+
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid JIRA_CACHE_TTL={value!r}; response cache disabled")
+        return 0
+
 
 class JiraClient:
     """Client for interacting with Jira REST API."""
 
-    def __init__(self, jira_url=None, api_token=None, email=None):
+    def __init__(self, jira_url=None, api_token=None, email=None, cache_ttl=None, cache_dir=None):
         """
         Initialize Jira client with URL and API token.
 
@@ -17,40 +55,74 @@ class JiraClient:
             jira_url: Jira server URL
             api_token: API token for authentication
             email: Email for Atlassian Cloud Basic Auth (required for Atlassian Cloud)
+            cache_ttl: Seconds to reuse identical search responses from disk
+                       (or use JIRA_CACHE_TTL env var, default: 0 = disabled)
+            cache_dir: Directory for cached responses (default: .cache/jira)
         """
         self.jira_url = jira_url or os.getenv("JIRA_URL", "https://issues.redhat.com")
         self.api_token = api_token or os.getenv("JIRA_API_TOKEN")
         self.email = email or os.getenv("JIRA_EMAIL")
+        self.cache_ttl = cache_ttl if cache_ttl is not None else _cache_ttl_from_env()
+        self.cache_dir = Path(cache_dir or ".cache/jira")
         # Debug logging is disabled by default to avoid leaking sensitive info in CI logs
 
         self.headers = {"Accept": "application/json"}
 
-    def fetch_jira_data(self, jql_query, max_results=50, expand=None, next_page_token=None):
+        # Pooled keep-alive connections shared by all page requests
+        self.session = create_session()
+
+    def _get_cache_file(self, url, body):
+        """Return the cache file for a search request (keyed on URL, user and body)."""
+        key = json.dumps([url, self.email, body], sort_keys=True)
+        return self.cache_dir / f"{hashlib.md5(key.encode()).hexdigest()}.json"
+
+    def _load_from_cache(self, cache_file):
+        """Load a cached search response if it is younger than cache_ttl."""
+        try:
+            if time.time() - cache_file.stat().st_mtime >= self.cache_ttl:
+                return None
+            with open(cache_file, "rb") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_to_cache(self, cache_file, data):
+        """Save a search response to the cache (best effort)."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to save Jira cache file {cache_file}: {e}")
+
+    def fetch_jira_data(
+        self, jql_query, max_results=50, expand=None, next_page_token=None, fields=None
+    ):
         """
         Fetch Jira Issue data with pagination support.
 
         Args:
             jql_query: JQL query string
-            max_results: Maximum results per request (default 50, max 100)
+            max_results: Maximum results per request (default 50; Jira may return fewer)
             expand: Optional fields to expand (e.g., 'changelog')
             next_page_token: Token for fetching next page (for pagination)
+            fields: Issue fields to return (default: DEFAULT_FIELDS)
 
         Returns:
             JSON response from Jira API or None on error
+
+        Note:
+            With cache_ttl > 0, successful responses are cached under cache_dir and
+            identical requests within cache_ttl seconds are answered from disk.
         """
         url = f"{self.jira_url}/rest/api/3/search/jql"
 
         # Prepare request body for POST request
         body = {
             "jql": jql_query,
-            "fields": [
-                "created",
-                "resolutiondate",
-                "status",
-                "issuetype",
-                "timeoriginalestimate",
-                "timetracking",
-            ],
+            "fields": list(fields or DEFAULT_FIELDS),
             "maxResults": max_results,
         }
 
@@ -64,6 +136,13 @@ class JiraClient:
         if next_page_token:
             body["nextPageToken"] = next_page_token
 
+        cache_file = self._get_cache_file(url, body) if self.cache_ttl > 0 else None
+        if cache_file is not None:
+            cached = self._load_from_cache(cache_file)
+            if cached is not None:
+                logger.debug(f"Using cached Jira response: {cache_file.name}")
+                return cached
+
         # Add Content-Type header for JSON body
         headers = {**self.headers, "Content-Type": "application/json"}
 
@@ -78,7 +157,7 @@ class JiraClient:
         try:
             # Use Basic Auth for Atlassian Cloud API
             auth = (self.email, self.api_token) if self.email else None
-            response = requests.post(url, headers=headers, json=body, auth=auth)
+            response = self.session.post(url, headers=headers, json=body, auth=auth)
 
             logger.debug(f"Response Status Code: {response.status_code}")
             logger.debug(f"Response URL: {response.url}")
@@ -89,7 +168,10 @@ class JiraClient:
                 logger.debug(f"Request Body: {body}")
 
             response.raise_for_status()
-            return response.json()
+            data = parse_json(response)
+            if cache_file is not None:
+                self._save_to_cache(cache_file, data)
+            return data
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching Jira data: {e}")
             logger.debug(f"Request failed with exception: {type(e).__name__}")
@@ -97,49 +179,85 @@ class JiraClient:
                 logger.debug(f"Response text: {e.response.text}")
             return None
 
-    def fetch_all_issues(self, jql_query, batch_size=50, expand=None):
+    def iter_all_issues(self, jql_query, batch_size=DEFAULT_BATCH_SIZE, expand=None, fields=None):
         """
-        Fetch all issues matching a JQL query with automatic pagination.
+        Iterate over all issues matching a JQL query, fetching pages on demand.
+
+        Only one page is held at a time, so consumers that process issues one by
+        one (e.g. writing rows) use memory proportional to batch_size rather than
+        the total result size. Use fetch_all_issues() when a list is needed.
 
         Note: Uses token-based pagination (nextPageToken) instead of offset-based (startAt).
         The API no longer returns a 'total' count in most cases.
 
+        If Jira returns fewer issues than requested on a page that is not the last,
+        the server has capped the page size; that size is used for later pages.
+
         Args:
             jql_query: JQL query string
-            batch_size: Number of issues per request (max 100)
+            batch_size: Number of issues per request (default 1000, capped by the server)
             expand: Optional fields to expand
+            fields: Issue fields to return (default: DEFAULT_FIELDS)
 
-        Returns:
-            List of all issues matching the query
+        Yields:
+            Issue dictionaries, in the order returned by Jira
         """
-        all_issues = []
         next_page_token = None
         page_count = 0
+        issue_count = 0
 
         while True:
             page_count += 1
             logger.debug(f"Fetching page {page_count}...")
 
             data = self.fetch_jira_data(
-                jql_query, max_results=batch_size, expand=expand, next_page_token=next_page_token
+                jql_query,
+                max_results=batch_size,
+                expand=expand,
+                next_page_token=next_page_token,
+                fields=fields,
             )
 
             if not data:
                 logger.warning(f"Failed to fetch page {page_count}")
-                break
-
-            if "issues" in data:
-                issues_in_page = len(data["issues"])
-                all_issues.extend(data["issues"])
-                logger.debug(f"Fetched {issues_in_page} issues (total so far: {len(all_issues)})")
-
-                # Check if there are more pages
-                next_page_token = data.get("nextPageToken")
-                if not next_page_token:
-                    logger.info(f"Completed fetching all issues. Total: {len(all_issues)}")
-                    break
-            else:
+                return
+
+            if "issues" not in data:
                 logger.warning("No 'issues' field in response")
-                break
+                return
+
+            issues = data["issues"]
+            issues_in_page = len(issues)
+            issue_count += issues_in_page
+            logger.debug(f"Fetched {issues_in_page} issues (total so far: {issue_count})")
+
+            yield from issues
+
+            # Check if there are more pages (isLast is authoritative when present)
+            next_page_token = data.get("nextPageToken")
+            if not next_page_token or data.get("isLast"):
+                logger.info(f"Completed fetching all issues. Total: {issue_count}")
+                return
+
+            if 0 < issues_in_page < batch_size:
+                logger.debug(f"Jira capped page size to {issues_in_page} (requested {batch_size})")
+                batch_size = issues_in_page
+
+    def fetch_all_issues(self, jql_query, batch_size=DEFAULT_BATCH_SIZE, expand=None, fields=None):
+        """
+        Fetch all issues matching a JQL query with automatic pagination.
+
+        See iter_all_issues() for pagination details.
+
+        Args:
+            jql_query: JQL query string
+            batch_size: Number of issues per request (default 1000, capped by the server)
+            expand: Optional fields to expand
+            fields: Issue fields to return (default: DEFAULT_FIELDS)
 
-        return all_issues
+        Returns:
+            List of all issues matching the query
+        """
+        return list(
+            self.iter_all_issues(jql_query, batch_size=batch_size, expand=expand, fields=fields)
+        )
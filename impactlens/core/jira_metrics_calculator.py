@@ -7,14 +7,21 @@ Extracted from cli/get_jira_metrics.py
 
 import os
 import json
-from datetime import datetime
 from pathlib import Path
 
-from impactlens.clients.jira_client import JiraClient
+from impactlens.clients.jira_client import DEFAULT_BATCH_SIZE, JiraClient
+from impactlens.utils.core_utils import (
+    calculate_state_durations,
+    convert_date_to_jql,
+    parse_datetime,
+)
 from impactlens.utils.logger import logger
 from impactlens.utils.report_utils import normalize_username
 from impactlens.utils.workflow_utils import load_members_emails
 
+# Jira custom field holding story points
+STORY_POINTS_FIELD = "customfield_12310243"
+
 
 class JiraMetricsCalculator:
     """
@@ -47,123 +54,19 @@ class JiraMetricsCalculator:
         Returns:
             Dictionary containing total time (seconds) and occurrence count for each state
         """
-        state_stats = {}
-
-        changelog = issue.get("changelog", {})
-        histories = changelog.get("histories", [])
-
-        created_str = issue["fields"].get("created")
-        current_status = issue["fields"].get("status", {}).get("name", "Unknown")
-        resolution_str = issue["fields"].get("resolutiondate")
-
-        if not created_str:
-            return {}
-
-        try:
-            created_date = datetime.strptime(created_str, "%Y-%m-%dT%H:%M:%S.%f%z")
-        except ValueError:
-            try:
-                created_date = datetime.strptime(created_str, "%Y-%m-%dT%H:%M:%S%z")
-            except ValueError:
-                return {}
-
-        # Build status transition history
-        status_transitions = []
-
-        for history in histories:
-            history_created = history.get("created")
-            if not history_created:
-                continue
-
-            try:
-                transition_date = datetime.strptime(history_created, "%Y-%m-%dT%H:%M:%S.%f%z")
-            except ValueError:
-                try:
-                    transition_date = datetime.strptime(history_created, "%Y-%m-%dT%H:%M:%S%z")
-                except ValueError:
-                    continue
-
-            for item in history.get("items", []):
-                if item.get("field") == "status":
-                    from_status = item.get("fromString")
-                    to_status = item.get("toString")
-                    status_transitions.append(
-                        {"date": transition_date, "from": from_status, "to": to_status}
-                    )
-
-        status_transitions.sort(key=lambda x: x["date"])
-
-        # Determine initial status
-        if status_transitions:
-            initial_status = status_transitions[0]["from"]
-        else:
-            initial_status = current_status
-
-        # Calculate time spent in each state
-        current_state = initial_status
-        current_state_start = created_date
-
-        if current_state:
-            if current_state not in state_stats:
-                state_stats[current_state] = {"total_seconds": 0, "count": 0}
-            state_stats[current_state]["count"] += 1
-
-        for transition in status_transitions:
-            if current_state:
-                duration = (transition["date"] - current_state_start).total_seconds()
-                state_stats[current_state]["total_seconds"] += duration
-
-            current_state = transition["to"]
-            current_state_start = transition["date"]
-
-            if current_state not in state_stats:
-                state_stats[current_state] = {"total_seconds": 0, "count": 0}
-            state_stats[current_state]["count"] += 1
-
-        # Calculate time for last state
-        if current_state:
-            if resolution_str:
-                try:
-                    end_date = datetime.strptime(resolution_str, "%Y-%m-%dT%H:%M:%S.%f%z")
-                except ValueError:
-                    try:
-                        end_date = datetime.strptime(resolution_str, "%Y-%m-%dT%H:%M:%S%z")
-                    except ValueError:
-                        end_date = datetime.now(current_state_start.tzinfo)
-            else:
-                end_date = datetime.now(current_state_start.tzinfo)
-
-            duration = (end_date - current_state_start).total_seconds()
-            state_stats[current_state]["total_seconds"] += duration
-
-        return state_stats
+        return calculate_state_durations(issue)
 
     def convert_date_to_jql(self, date_str):
         """
         Convert YYYY-MM-DD format date to Jira JQL relative time expression.
 
         Args:
-            date_str: Date string in YYYY-MM-DD format
+            date_str: Date string in YYYY-MM-DD format, or a date/datetime object
 
         Returns:
             JQL time expression (e.g., "-300d")
         """
-        if not date_str:
-            return None
-
-        try:
-            input_date = datetime.strptime(date_str, "%Y-%m-%d")
-            today = datetime.now()
-            days_diff = (today - input_date).days
-
-            if days_diff == 0:
-                return "startOfDay()"
-            elif days_diff > 0:
-                return f'"-{days_diff}d"'
-            else:
-                return f'"{abs(days_diff)}d"'
-        except ValueError:
-            return f'"{date_str}"'
+        return convert_date_to_jql(date_str)
 
     def build_jql_query(
         self,
@@ -233,26 +136,40 @@ class JiraMetricsCalculator:
 
         return " AND ".join(jql_parts), members
 
-    def fetch_all_issues(self, jql_query, batch_size=50):
+    def iter_all_issues(self, jql_query, batch_size=DEFAULT_BATCH_SIZE):
         """
-        Fetch all issues matching JQL query with pagination.
+        Iterate over all issues matching JQL query, one page at a time.
 
-        Uses JiraClient's token-based pagination (API v3).
+        Lets calculate_metrics() consume issues as they arrive, so only the current
+        page of changelog-expanded issues is held in memory.
 
         Args:
             jql_query: JQL query string
             batch_size: Results per page
 
         Returns:
-            List of all issues with changelog data
+            Iterator over issues with changelog data
         """
         logger.info(f"Fetching all issues for JQL: {jql_query}")
-
-        # Use JiraClient's fetch_all_issues with changelog expansion
-        all_issues = self.jira_client.fetch_all_issues(
+        return self.jira_client.iter_all_issues(
             jql_query, batch_size=batch_size, expand="changelog"
         )
 
+    def fetch_all_issues(self, jql_query, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Fetch all issues matching JQL query with pagination.
+
+        Uses JiraClient's token-based pagination (API v3).
+
+        Args:
+            jql_query: JQL query string
+            batch_size: Results per page
+
+        Returns:
+            List of all issues with changelog data
+        """
+        all_issues = list(self.iter_all_issues(jql_query, batch_size=batch_size))
+
         logger.info(f"Total issues fetched for analysis: {len(all_issues)}")
         return all_issues
 
@@ -260,22 +177,26 @@ class JiraMetricsCalculator:
         """
         Calculate comprehensive metrics from issues.
 
+        Issues are processed in a single pass, so a generator such as
+        iter_all_issues() can be passed to avoid holding every issue in memory.
+
         Args:
-            issues: List of Jira issues
+            issues: Iterable of Jira issues
 
         Returns:
             Dictionary containing all calculated metrics
         """
-        if not issues:
-            return self._empty_metrics()
-
+        total_issues = 0
         closing_times = []
         created_dates = []
         resolution_dates = []
         issue_types = {}
+        all_states_aggregated = {}
 
-        # Calculate basic metrics
         for issue in issues:
+            total_issues += 1
+
+            # Calculate basic metrics
             try:
                 created_str = issue["fields"].get("created")
                 resolution_str = issue["fields"].get("resolutiondate")
@@ -285,10 +206,9 @@ class JiraMetricsCalculator:
                     issue_types[issue_type] = 0
                 issue_types[issue_type] += 1
 
-                if created_str and resolution_str:
-                    created_date = datetime.strptime(created_str, "%Y-%m-%dT%H:%M:%S.%f%z")
-                    resolution_date = datetime.strptime(resolution_str, "%Y-%m-%dT%H:%M:%S.%f%z")
-
+                created_date = parse_datetime(created_str)
+                resolution_date = parse_datetime(resolution_str)
+                if created_date and resolution_date:
                     created_dates.append(created_date)
                     resolution_dates.append(resolution_date)
 
@@ -297,9 +217,7 @@ class JiraMetricsCalculator:
             except Exception as e:
                 logger.warning(f"Error processing issue {issue.get('key', 'unknown')}: {e}")
 
-        # Calculate state durations
-        all_states_aggregated = {}
-        for issue in issues:
+            # Calculate state durations
             state_stats = self.calculate_state_durations(issue)
 
             for state, stats in state_stats.items():
@@ -313,8 +231,11 @@ class JiraMetricsCalculator:
                 all_states_aggregated[state]["total_count"] += stats["count"]
                 all_states_aggregated[state]["issue_count"] += 1
 
+        if not total_issues:
+            return self._empty_metrics()
+
         return {
-            "total_issues": len(issues),
+            "total_issues": total_issues,
             "issue_types": issue_types,
             "closing_times": closing_times,
             "created_dates": created_dates,
@@ -333,7 +254,9 @@ class JiraMetricsCalculator:
             "state_stats": {},
         }
 
-    def calculate_velocity(self, project_key, start_date=None, end_date=None, batch_size=50):
+    def calculate_velocity(
+        self, project_key, start_date=None, end_date=None, batch_size=DEFAULT_BATCH_SIZE
+    ):
         """
         Calculate velocity based on story points.
 
@@ -360,26 +283,19 @@ class JiraMetricsCalculator:
 
         logger.debug(f"Story query JQL: {jql_stories}")
 
-        # Use JiraClient's fetch_all_issues for token-based pagination
-        all_stories = self.jira_client.fetch_all_issues(
-            jql_stories, batch_size=batch_size, expand="changelog"
+        # Only story points are read here, so skip the changelog and default fields,
+        # and stream the stories rather than holding every page in memory
+        stories = self.jira_client.iter_all_issues(
+            jql_stories, batch_size=batch_size, fields=[STORY_POINTS_FIELD]
         )
 
-        total_stories = len(all_stories)
-
-        if total_stories == 0:
-            return {
-                "total_stories": 0,
-                "stories_with_points": 0,
-                "total_story_points": 0,
-                "avg_points_per_story": 0,
-            }
-
+        total_stories = 0
         total_story_points = 0
         stories_with_points = 0
 
-        for story in all_stories:
-            story_points = story["fields"].get("customfield_12310243")
+        for story in stories:
+            total_stories += 1
+            story_points = story["fields"].get(STORY_POINTS_FIELD)
             if story_points:
                 total_story_points += float(story_points)
                 stories_with_points += 1
@@ -24,6 +24,7 @@ from impactlens.utils.workflow_utils import (
     upload_to_google_sheets,
     handle_comparison_report_generation,
     load_members_emails,
+    run_member_commands,
     load_and_resolve_config,
     load_members_from_yaml,
     aggregate_member_values_for_phases,
@@ -132,6 +133,7 @@ def generate_all_members_reports(
     upload_members: bool = False,
     config_file: Optional[Path] = None,
     hide_individual_names: bool = False,
+    parallel_members: int = 1,
 ) -> int:
     """
     Generate reports for all team members.
@@ -143,6 +145,7 @@ def generate_all_members_reports(
         upload_members: If True, upload member reports (default: False, only team report is uploaded)
         config_file: Optional custom config file to pass to subcommands
         hide_individual_names: If True, anonymize individual names in reports
+        parallel_members: Number of member reports to generate at the same time
     """
     print_header("Generating reports for all team members")
 
@@ -170,12 +173,8 @@ def generate_all_members_reports(
 
     # Generate individual reports for each member
     # Only upload if --upload-members is specified (and --no-upload is not set)
-    failed_members = []
+    member_cmds = {}
     for member in members:
-        # Get display identifier for member
-        display_member = get_identifier_for_display(member, hide_individual_names)
-        print(f"{Colors.BLUE}>>> Generating Report for: {display_member}{Colors.NC}")
-        print()
         cmd = [sys.executable, "-m", script_name, member]
         if config_file:
             cmd.extend(["--config", str(config_file)])
@@ -184,11 +183,29 @@ def generate_all_members_reports(
             cmd.append("--no-upload")
         if hide_individual_names:
             cmd.append("--hide-individual-names")
-        result = subprocess.run(cmd)
-        if result.returncode != 0:
-            failed_members.append(member)
+        member_cmds[member] = cmd
+
+    failed_members = []
+    if parallel_members > 1:
+        print(
+            f"{Colors.BLUE}>>> Generating {len(member_cmds)} member reports "
+            f"({parallel_members} at a time){Colors.NC}"
+        )
         print()
+        results = run_member_commands(member_cmds, max_workers=parallel_members)
+        failed_members = [member for member, ok in results.items() if not ok]
         print()
+    else:
+        for member, cmd in member_cmds.items():
+            # Get display identifier for member
+            display_member = get_identifier_for_display(member, hide_individual_names)
+            print(f"{Colors.BLUE}>>> Generating Report for: {display_member}{Colors.NC}")
+            print()
+            result = subprocess.run(cmd)
+            if result.returncode != 0:
+                failed_members.append(member)
+            print()
+            print()
 
     # Summary
     print(f"{Colors.GREEN}{'=' * 40}{Colors.NC}")
@@ -320,6 +337,7 @@ Examples:
             upload_members=args.upload_members,
             config_file=config_file,
             hide_individual_names=args.hide_individual_names,
+            parallel_members=args.parallel_members,
         )
 
     # Determine assignee
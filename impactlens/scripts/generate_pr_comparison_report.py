@@ -27,7 +27,7 @@ from impactlens.utils.report_utils import (
 from impactlens.utils.workflow_utils import (
     load_config_file,
     get_project_root,
-    load_members_from_yaml,
+    load_member_email_index,
 )
 
 
@@ -59,14 +59,9 @@ def main():
     if args.author:
         # Try to find email for this author from config
         config_file = custom_config_file if custom_config_file else default_config_file
-        if config_file.exists():
-            members_detailed = load_members_from_yaml(config_file)
-            for member_id, member_info in members_detailed.items():
-                if member_info.get("git_username") == args.author:
-                    # Found the member, use email for anonymization if available
-                    if member_info.get("email"):
-                        anonymization_identifier = member_info.get("email")
-                    break
+        author_email = load_member_email_index(config_file).get(args.author)
+        if author_email:
+            anonymization_identifier = author_email
 
     # Find matching reports using shared utility
     report_files = find_comparison_reports(
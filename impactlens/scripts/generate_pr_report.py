@@ -24,6 +24,8 @@ from impactlens.utils.workflow_utils import (
     upload_to_google_sheets,
     handle_comparison_report_generation,
     load_members_from_yaml,
+    load_member_email_index,
+    run_member_commands,
     load_and_resolve_config,
     aggregate_member_values_for_phases,
 )
@@ -136,6 +138,7 @@ def generate_all_members_reports(
     upload_members: bool = False,
     config_file: Optional[Path] = None,
     hide_individual_names: bool = False,
+    parallel_members: int = 1,
 ) -> int:
     """
     Generate reports for all team members.
@@ -147,6 +150,7 @@ def generate_all_members_reports(
         upload_members: If True, upload member reports (default: False, only team report is uploaded)
         config_file: Optional custom config file path
         hide_individual_names: If True, anonymize individual names in reports
+        parallel_members: Number of member reports to generate at the same time
     """
     print_header("Generating reports for all team members")
 
@@ -175,7 +179,8 @@ def generate_all_members_reports(
 
     # Generate individual reports for each member
     # Only upload if --upload-members is specified (and --no-upload is not set)
-    failed_members = []
+    member_cmds = {}
+    member_displays = {}
     for member_id, member_info in members_detailed.items():
         # Use 'name' (GitHub username) for API query
         # The script will automatically look up email from config for anonymization
@@ -184,9 +189,9 @@ def generate_all_members_reports(
 
         # Get display identifier for member (use email for anonymization if available)
         display_identifier = member_email if member_email else git_username
-        display_member = get_identifier_for_display(display_identifier, hide_individual_names)
-        print(f"{Colors.BLUE}>>> Generating Report for: {display_member}{Colors.NC}")
-        print()
+        member_displays[git_username] = get_identifier_for_display(
+            display_identifier, hide_individual_names
+        )
 
         # Pass GitHub username for API query
         # The script will find the corresponding email from config automatically
@@ -198,11 +203,29 @@ def generate_all_members_reports(
             cmd.append("--no-upload")
         if hide_individual_names:
             cmd.append("--hide-individual-names")
-        result = subprocess.run(cmd)
-        if result.returncode != 0:
-            failed_members.append(git_username)
+        member_cmds[git_username] = cmd
+
+    failed_members = []
+    if parallel_members > 1:
+        print(
+            f"{Colors.BLUE}>>> Generating {len(member_cmds)} member reports "
+            f"({parallel_members} at a time){Colors.NC}"
+        )
         print()
+        results = run_member_commands(member_cmds, max_workers=parallel_members)
+        failed_members = [member for member, ok in results.items() if not ok]
         print()
+    else:
+        for git_username, cmd in member_cmds.items():
+            print(
+                f"{Colors.BLUE}>>> Generating Report for: {member_displays[git_username]}{Colors.NC}"
+            )
+            print()
+            result = subprocess.run(cmd)
+            if result.returncode != 0:
+                failed_members.append(git_username)
+            print()
+            print()
 
     # Summary
     print(f"{Colors.GREEN}{'=' * 40}{Colors.NC}")
@@ -342,6 +365,7 @@ Examples:
             upload_members=args.upload_members,
             config_file=config_file,
             hide_individual_names=args.hide_individual_names,
+            parallel_members=args.parallel_members,
         )
 
     # Determine author
@@ -351,14 +375,10 @@ Examples:
     # This ensures the same person gets the same hash in both Jira and PR reports
     anonymization_identifier = author
     if author:
-        # Try to find email for this author from config
-        members_detailed = load_members_from_yaml(config_file)
-        for member_id, member_info in members_detailed.items():
-            if member_info.get("git_username") == author:
-                # Found the member, use email for anonymization if available
-                if member_info.get("email"):
-                    anonymization_identifier = member_info.get("email")
-                break
+        # Try to find email for this author from config, use it for anonymization if available
+        author_email = load_member_email_index(config_file).get(author)
+        if author_email:
+            anonymization_identifier = author_email
 
     if author:
         # Get display identifier for author (use anonymization_identifier for consistent hash)
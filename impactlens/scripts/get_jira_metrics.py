@@ -65,16 +65,12 @@ def main():
     else:
         print(f"\nJQL query prepared (hidden for privacy)\n")
 
-    # Fetch all issues
-    all_issues = calculator.fetch_all_issues(jql_query)
+    # Fetch issues page by page and calculate metrics as they arrive
+    metrics = calculator.calculate_metrics(calculator.iter_all_issues(jql_query))
 
-    if not all_issues:
+    if not metrics["total_issues"]:
+        # Empty metrics generate an empty report
         print("No issues found matching the criteria.")
-        # Generate empty report
-        metrics = calculator._empty_metrics()
-    else:
-        # Calculate metrics
-        metrics = calculator.calculate_metrics(all_issues)
 
     # Calculate throughput variants and add to metrics (same flow as PR report)
     # This allows us to use the same utility functions in both Jira and PR reports
@@ -21,7 +21,7 @@ from impactlens.core.pr_metrics_calculator import PRMetricsCalculator
 from impactlens.core.pr_report_generator import PRReportGenerator
 from impactlens.utils.logger import logger
 from impactlens.utils.report_utils import get_identifier_for_display
-from impactlens.utils.workflow_utils import load_members_from_yaml
+from impactlens.utils.workflow_utils import load_members_from_yaml, load_member_email_index
 from impactlens.utils.common_args import add_pr_metrics_args
 from impactlens.utils.cli_utils import parse_leave_days_capacity, validate_date_range
 
@@ -67,17 +67,12 @@ Examples:
     anonymization_identifier = None
     if args.author and args.config:
         config_path = Path(args.config)
-        if config_path.exists():
-            members_detailed = load_members_from_yaml(config_path)
-            for member_id, member_info in members_detailed.items():
-                if member_info.get("git_username") == args.author:
-                    email = member_info.get("email")
-                    if not email:
-                        raise ValueError(
-                            f"Email is required for member '{args.author}' in config file"
-                        )
-                    anonymization_identifier = email
-                    break
+        member_emails = load_member_email_index(config_path)
+        if args.author in member_emails:
+            email = member_emails[args.author]
+            if not email:
+                raise ValueError(f"Email is required for member '{args.author}' in config file")
+            anonymization_identifier = email
 
     print("\n📊 Collecting GitHub PR metrics...")
     print(f"Period: {args.start} to {args.end}")
@@ -14,10 +14,10 @@ import os
 import sys
 from pathlib import Path
 from typing import Dict, List
-import yaml
 
 from impactlens.utils.email_notifier import notify_members
 from impactlens.utils.anonymization import _global_anonymizer
+from impactlens.utils.workflow_utils import read_yaml_config
 
 
 def collect_members_from_config(config_path: Path) -> List[Dict]:
@@ -34,8 +34,8 @@ def collect_members_from_config(config_path: Path) -> List[Dict]:
         return []
 
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        # Shares the parse done by get_email_anonymous_id_enabled (libyaml, cached)
+        config = read_yaml_config(config_path)
         return config.get("members", [])
     except Exception as e:
         print(f"Warning: Failed to load config {config_path}: {e}")
@@ -90,8 +90,7 @@ def collect_all_members(config_dir: Path) -> tuple[List[Dict], bool]:
         print(f"Aggregation mode detected: {aggregation_config}")
 
         try:
-            with open(aggregation_config, "r") as f:
-                agg_config = yaml.safe_load(f)
+            agg_config = read_yaml_config(aggregation_config)
 
             projects = agg_config.get("aggregation", {}).get("projects", [])
             print(f"Found {len(projects)} projects: {', '.join(projects)}")
@@ -209,13 +208,12 @@ def main():
     from impactlens.utils.report_utils import normalize_username
 
     print("Generating anonymous identifiers...")
-    anon_count = 0
-    for member in members:
-        email = member.get("email")
-        if email and "@" in email:
-            identifier = normalize_username(email)
-            _global_anonymizer.anonymize(identifier)
-            anon_count += 1
+    identifiers = [
+        normalize_username(email)
+        for member in members
+        if (email := member.get("email")) and "@" in email
+    ]
+    anon_count = _global_anonymizer.bulk_anonymize(identifiers)
     print(f"  Generated {anon_count} anonymous identifiers\n")
 
     # Get PR URL from environment (if in CI)
@@ -37,11 +37,9 @@ import argparse
 import traceback
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
-# Add parent directory to path to allow imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from clients.sheets_client import (
+from impactlens.clients.sheets_client import (
     get_credentials,
     build_service,
     create_spreadsheet,
@@ -49,13 +47,13 @@ from clients.sheets_client import (
     format_sheet,
     get_service_account_email,
 )
-from utils.core_utils import (
+from impactlens.utils.core_utils import (
     read_tsv_report,
     normalize_username,
     read_ai_analysis_report,
     generate_sheet_name_from_report,
 )
-from utils.workflow_utils import extract_sheet_prefix
+from impactlens.utils.workflow_utils import extract_sheet_prefix
 from impactlens.utils.common_args import add_upload_to_sheets_args
 
 try:
@@ -71,7 +69,14 @@ except ImportError:
     sys.exit(1)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
+    """
+    Upload a report to Google Sheets.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]); lets other
+              modules run an upload in-process
+    """
     parser = argparse.ArgumentParser(
         description="Upload Jira comparison reports to Google Sheets",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -105,7 +110,7 @@ Note:
     )
 
     add_upload_to_sheets_args(parser)
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Get spreadsheet ID from env var if not provided
     if not args.spreadsheet_id:
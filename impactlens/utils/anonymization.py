@@ -7,6 +7,7 @@ while maintaining consistency across the report.
 
 import hashlib
 import os
+import threading
 from typing import Dict, List
 
 
@@ -16,6 +17,8 @@ class NameAnonymizer:
     def __init__(self):
         """Initialize the anonymizer with an empty name mapping."""
         self._name_map: Dict[str, str] = {}
+        # Guards _name_map; the global anonymizer is shared across threads
+        self._lock = threading.Lock()
 
     def _generate_hash_id(self, name: str) -> str:
         """
@@ -47,10 +50,43 @@ class NameAnonymizer:
             Anonymous ID (e.g., "Developer-A3F2", "Developer-B7E1")
             Same name always produces same ID across different runs.
         """
-        if not name or name.lower() in ["general", "team", ""]:
+        if self._is_team_level(name):
             # Don't anonymize team-level or empty names
             return name
 
+        with self._lock:
+            return self._get_or_create_id(name)
+
+    def bulk_anonymize(self, names: List[str]) -> int:
+        """
+        Pre-populate the mapping for many names under a single lock acquisition.
+
+        Args:
+            names: Names to anonymize (team-level and empty names are skipped)
+
+        Returns:
+            Number of names processed
+        """
+        count = 0
+        with self._lock:
+            for name in names:
+                if self._is_team_level(name):
+                    continue
+                self._get_or_create_id(name)
+                count += 1
+        return count
+
+    @staticmethod
+    def _is_team_level(name: str) -> bool:
+        """Return True for empty or team-level names, which are never anonymized."""
+        return not name or name.lower() in ["general", "team", ""]
+
+    def _get_or_create_id(self, name: str) -> str:
+        """
+        Return the anonymous ID for a name, creating it if needed.
+
+        Callers must hold self._lock.
+        """
         # Return existing mapping if already anonymized
         if name in self._name_map:
             return self._name_map[name]
@@ -90,11 +126,13 @@ class NameAnonymizer:
         Returns:
             Dictionary mapping real names to anonymous IDs
         """
-        return self._name_map.copy()
+        with self._lock:
+            return self._name_map.copy()
 
     def clear(self):
         """Clear all anonymization mappings."""
-        self._name_map.clear()
+        with self._lock:
+            self._name_map.clear()
         self._counter = 0
 
 
@@ -67,6 +67,13 @@ def add_report_generation_args(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Combine existing TSV reports without regenerating",
     )
+    parser.add_argument(
+        "--parallel-members",
+        type=int,
+        default=1,
+        metavar="N",
+        help="With --all-members, generate up to N member reports at the same time (default: 1)",
+    )
 
 
 # ============================================================================
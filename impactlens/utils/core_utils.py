@@ -2,7 +2,17 @@
 
 import csv
 import re
-from datetime import datetime
+from datetime import date, datetime
+from operator import itemgetter
+from typing import Callable
+
+# Optional faster ISO-8601 parser; fromisoformat handles the same Jira formats
+try:
+    import ciso8601
+
+    _parse_iso: Callable[[str], datetime] = ciso8601.parse_datetime
+except ImportError:
+    _parse_iso = datetime.fromisoformat
 
 
 def calculate_days_between(start_date, end_date, inclusive=True):
@@ -133,7 +143,7 @@ def convert_date_to_jql(date_str):
     Convert YYYY-MM-DD format date to Jira JQL relative time expression.
 
     Args:
-        date_str: Date string in YYYY-MM-DD format
+        date_str: Date string in YYYY-MM-DD format, or a date/datetime object
 
     Returns:
         JQL time expression (e.g., "-300d" for 300 days ago)
@@ -141,20 +151,25 @@ def convert_date_to_jql(date_str):
     if not date_str:
         return None
 
-    try:
-        input_date = datetime.strptime(date_str, "%Y-%m-%d")
-        today = datetime.now()
+    # Date objects need no parsing; datetimes are compared by calendar day
+    if isinstance(date_str, datetime):
+        input_date = date_str.date()
+    elif isinstance(date_str, date):
+        input_date = date_str
+    else:
+        try:
+            input_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            return f'"{date_str}"'
 
-        days_diff = (today - input_date).days
+    days_diff = (date.today() - input_date).days
 
-        if days_diff == 0:
-            return "startOfDay()"
-        elif days_diff > 0:
-            return f'"-{days_diff}d"'
-        else:
-            return f'"{abs(days_diff)}d"'
-    except ValueError:
-        return f'"{date_str}"'
+    if days_diff == 0:
+        return "startOfDay()"
+    elif days_diff > 0:
+        return f'"-{days_diff}d"'
+    else:
+        return f'"{abs(days_diff)}d"'
 
 
 def parse_datetime(datetime_str):
@@ -170,6 +185,16 @@ def parse_datetime(datetime_str):
     if not datetime_str:
         return None
 
+    # Fast path: ciso8601 (the "fast" extra) or fromisoformat, both implemented
+    # in C and accepting Jira's "+0000" offsets, avoiding strptime's format parsing
+    try:
+        parsed = _parse_iso(datetime_str)
+    except (TypeError, ValueError):
+        parsed = None
+    if parsed is not None:
+        # Jira timestamps always carry an offset; keep rejecting naive values
+        return parsed if parsed.tzinfo is not None else None
+
     try:
         return datetime.strptime(datetime_str, "%Y-%m-%dT%H:%M:%S.%f%z")
     except ValueError:
@@ -189,8 +214,6 @@ def calculate_state_durations(issue):
     Returns:
         Dict mapping state names to statistics (total_seconds, count)
     """
-    state_stats = {}
-
     changelog = issue.get("changelog", {})
     histories = changelog.get("histories", [])
 
@@ -205,67 +228,50 @@ def calculate_state_durations(issue):
     if not created_date:
         return {}
 
-    # Build status transition history
-    status_transitions = []
-
-    for history in histories:
-        history_created = history.get("created")
-        if not history_created:
-            continue
+    # Pick out status changes first so only their timestamps get parsed; most
+    # changelog entries touch other fields (assignee, sprint, description, ...)
+    status_changes = [
+        (history.get("created"), item.get("fromString"), item.get("toString"))
+        for history in histories
+        for item in history.get("items", [])
+        if item.get("field") == "status"
+    ]
 
+    # Build status transition history as (date, from, to) tuples
+    status_transitions = []
+    for history_created, from_status, to_status in status_changes:
         transition_date = parse_datetime(history_created)
-        if not transition_date:
-            continue
-
-        for item in history.get("items", []):
-            if item.get("field") == "status":
-                from_status = item.get("fromString")
-                to_status = item.get("toString")
-                status_transitions.append(
-                    {"date": transition_date, "from": from_status, "to": to_status}
-                )
+        if transition_date:
+            status_transitions.append((transition_date, from_status, to_status))
 
-    # Sort by time
-    status_transitions.sort(key=lambda x: x["date"])
+    # Sort by time (stable, so same-timestamp items keep changelog order)
+    status_transitions.sort(key=itemgetter(0))
 
-    # Determine initial status
-    if status_transitions:
-        initial_status = status_transitions[0]["from"]
-    else:
-        initial_status = current_status
-
-    # Calculate time spent in each state
-    current_state = initial_status
+    # Single scan: the initial state runs from creation to the first transition,
+    # each later state from its transition to the next one
+    state_stats = {}
+    current_state = status_transitions[0][1] if status_transitions else current_status
     current_state_start = created_date
 
-    # Initialize first state
     if current_state:
-        if current_state not in state_stats:
-            state_stats[current_state] = {"total_seconds": 0, "count": 0}
-        state_stats[current_state]["count"] += 1
+        state_stats[current_state] = {"total_seconds": 0, "count": 1}
 
-    # Process all transitions
-    for transition in status_transitions:
+    for transition_date, _, to_status in status_transitions:
         if current_state:
-            duration = (transition["date"] - current_state_start).total_seconds()
+            duration = (transition_date - current_state_start).total_seconds()
             state_stats[current_state]["total_seconds"] += duration
 
-        current_state = transition["to"]
-        current_state_start = transition["date"]
+        current_state = to_status
+        current_state_start = transition_date
 
-        if current_state not in state_stats:
-            state_stats[current_state] = {"total_seconds": 0, "count": 0}
-        state_stats[current_state]["count"] += 1
+        if current_state in state_stats:
+            state_stats[current_state]["count"] += 1
+        else:
+            state_stats[current_state] = {"total_seconds": 0, "count": 1}
 
     # Calculate time for last state
     if current_state:
-        if resolution_str:
-            end_date = parse_datetime(resolution_str)
-            if not end_date:
-                end_date = datetime.now(current_state_start.tzinfo)
-        else:
-            end_date = datetime.now(current_state_start.tzinfo)
-
+        end_date = parse_datetime(resolution_str) or datetime.now(current_state_start.tzinfo)
         duration = (end_date - current_state_start).total_seconds()
         state_stats[current_state]["total_seconds"] += duration
 
@@ -7,6 +7,7 @@ Uses GitHub raw URLs for embedding images with =IMAGE() formula.
 
 import os
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 import requests
@@ -82,6 +83,40 @@ def create_branch(
         raise Exception(f"Failed to create branch: {response.text}")
 
 
+def get_existing_file_sha(
+    repo: str, github_path: str, branch: str, token: Optional[str] = None
+) -> Optional[str]:
+    """
+    Get the blob SHA of a file in the repository, if it exists.
+
+    Args:
+        repo: Repository in format "owner/repo"
+        github_path: Path in the repository (e.g., "team/charts/image.png")
+        branch: Branch to look in
+        token: GitHub token (uses GITHUB_TOKEN env var if not provided)
+
+    Returns:
+        SHA of the existing file, or None if it does not exist
+    """
+    if token is None:
+        token = get_github_token()
+
+    url = f"https://api.github.com/repos/{repo}/contents/{github_path}"
+    headers = {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json",
+    }
+
+    response = requests.get(url, headers=headers, params={"ref": branch})
+    if response.status_code != 200:
+        return None
+
+    # A directory at this path comes back as a list of entries, not a file object
+    content = response.json()
+    sha = content.get("sha") if isinstance(content, dict) else None
+    return sha if isinstance(sha, str) else None
+
+
 def upload_file_to_github(
     repo: str,
     file_path: str,
@@ -89,6 +124,8 @@ def upload_file_to_github(
     branch: str,
     token: Optional[str] = None,
     commit_message: Optional[str] = None,
+    existing_sha: Optional[str] = None,
+    lookup_existing: bool = True,
 ) -> str:
     """
     Upload a file to GitHub repository.
@@ -100,6 +137,9 @@ def upload_file_to_github(
         branch: Branch to upload to
         token: GitHub token (uses GITHUB_TOKEN env var if not provided)
         commit_message: Commit message (auto-generated if None)
+        existing_sha: SHA of the file being replaced, if already known
+        lookup_existing: If True, query GitHub for the existing SHA first;
+                         pass False when existing_sha was fetched ahead of time
 
     Returns:
         SHA of the created file
@@ -131,10 +171,8 @@ def upload_file_to_github(
     }
 
     # Check if file already exists to get its SHA
-    existing_sha = None
-    get_response = requests.get(url, headers=headers, params={"ref": branch})
-    if get_response.status_code == 200:
-        existing_sha = get_response.json()["sha"]
+    if lookup_existing:
+        existing_sha = get_existing_file_sha(repo, github_path, branch, token)
 
     data = {
         "message": commit_message,
@@ -216,10 +254,27 @@ def upload_charts_to_github(
     results = {}
 
     github_base_path = f"{team_name}/{report_type}/charts"
+    github_paths = [f"{github_base_path}/{Path(chart_file).name}" for chart_file in chart_files]
 
-    for chart_file in chart_files:
+    # Look up existing file SHAs concurrently (read-only requests). The uploads
+    # themselves stay sequential: each one commits to the branch head, so
+    # parallel commits to the same branch would conflict.
+    def prefetch_sha(github_path):
+        try:
+            return True, get_existing_file_sha(repo, github_path, branch_name, token)
+        except Exception:
+            # Retried inline by upload_file_to_github so the failure stays per-file
+            return False, None
+
+    prefetched = []
+    if github_paths:
+        with ThreadPoolExecutor(max_workers=min(8, len(github_paths))) as executor:
+            prefetched = list(executor.map(prefetch_sha, github_paths))
+
+    for chart_file, github_path, (sha_known, existing_sha) in zip(
+        chart_files, github_paths, prefetched
+    ):
         filename = Path(chart_file).name
-        github_path = f"{github_base_path}/{filename}"
 
         try:
             upload_file_to_github(
@@ -229,6 +284,8 @@ def upload_charts_to_github(
                 branch=branch_name,
                 token=token,
                 commit_message=f"Add chart: {filename}",
+                existing_sha=existing_sha,
+                lookup_existing=not sha_known,
             )
 
             # Generate raw URL
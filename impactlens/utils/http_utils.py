@@ -0,0 +1,79 @@
+"""
+HTTP utility functions.
+
+This module provides shared HTTP session setup and response decoding for the
+REST API clients.
+"""
+
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional faster JSON decoder
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Transient statuses worth retrying (rate limiting and gateway/server errors)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session(
+    pool_connections: int = 16, pool_maxsize: int = 32, max_retries: int = 3
+) -> requests.Session:
+    """
+    Create a requests session with pooled keep-alive connections and retries.
+
+    Reusing one session keeps TCP/TLS connections open between API calls, so
+    paginated and per-PR requests skip a handshake each. Transient failures are
+    retried with exponential backoff; the final response is still returned so
+    callers keep handling errors via raise_for_status().
+
+    Args:
+        pool_connections: Number of host connection pools to cache
+        pool_maxsize: Maximum connections kept per host (bounds concurrent callers)
+        max_retries: Retries for connection errors and RETRY_STATUS_CODES
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUS_CODES,
+        # Jira search is a read-only POST, so it is safe to retry as well
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def parse_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body.
+
+    Uses orjson when installed (the "fast" extra), which parses large API pages
+    several times faster than the standard library; otherwise falls back to
+    response.json().
+
+    Args:
+        response: Response with a JSON body
+
+    Returns:
+        Decoded JSON data
+    """
+    if not ORJSON_AVAILABLE:
+        return response.json()
+    return orjson.loads(response.content)
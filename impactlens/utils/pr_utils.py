@@ -4,8 +4,19 @@ PR-related utility functions.
 This module provides shared utilities for PR analysis across different GitHub clients.
 """
 
+import re
 from typing import Dict, List, Any
 
+# AI assistance markers in lowercased commit messages, e.g. "assisted-by: claude"
+# or "code-assisted with cursor ai". Captures the tool name.
+AI_MARKER_PATTERN = re.compile(
+    r"(?:assisted-by: |assisted by |co-authored-by: |code-assisted with |code assisted by )"
+    r"(claude|cursor)"
+)
+
+# Canonical display name for each tool captured by AI_MARKER_PATTERN
+AI_TOOL_NAMES = {"claude": "Claude", "cursor": "Cursor"}
+
 
 def extract_ai_info_from_commits(commits: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
@@ -61,36 +72,18 @@ def extract_ai_info_from_commits(commits: List[Dict[str, Any]]) -> Dict[str, Any
     ai_commits = 0
     total_commits = len(commits)
 
-    # Define detection patterns
-    claude_patterns = [
-        "assisted-by: claude",
-        "assisted by claude",
-        "co-authored-by: claude",
-        "code-assisted with claude",
-        "code assisted by claude",
-    ]
-
-    cursor_patterns = [
-        "assisted-by: cursor",
-        "assisted by cursor",
-        "co-authored-by: cursor",
-        "code-assisted with cursor",  # Matches "Code-assisted with Cursor AI"
-        "code assisted by cursor",
-    ]
-
     for commit in commits:
-        message = commit.get("commit", {}).get("message", "")
-        message_lower = message.lower()
-
-        # Check for Claude markers
-        if any(pattern in message_lower for pattern in claude_patterns):
-            ai_tools.add("Claude")
-            ai_commits += 1
-
-        # Check for Cursor markers
-        if any(pattern in message_lower for pattern in cursor_patterns):
-            ai_tools.add("Cursor")
-            ai_commits += 1
+        message_lower = commit.get("commit", {}).get("message", "").lower()
+
+        # Most commits name no tool at all; a plain substring test skips the regex for them
+        if "claude" not in message_lower and "cursor" not in message_lower:
+            continue
+
+        # Each tool marked in a commit counts once towards ai_commits
+        commit_tools = set(AI_MARKER_PATTERN.findall(message_lower))
+        for tool in commit_tools:
+            ai_tools.add(AI_TOOL_NAMES[tool])
+        ai_commits += len(commit_tools)
 
     return {
         "has_ai_assistance": len(ai_tools) > 0,
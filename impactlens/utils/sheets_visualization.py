@@ -6,6 +6,7 @@ mimicking the HTML visualization report layout.
 """
 
 import os
+from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
 
@@ -37,12 +38,21 @@ def create_visualization_sheet(
         - spreadsheet_id: The spreadsheet ID
         - sheet_name: The created sheet name
         - url: URL to the spreadsheet
+        If chart_github_links is empty, no sheet is created and url is empty
+        unless an existing spreadsheet_id was given.
     """
-    from impactlens.clients.sheets_client import (
-        create_spreadsheet,
-        get_existing_sheets,
-        cleanup_old_sheets,
-    )
+    # Nothing to embed: skip the tab creation and batchUpdate round-trips entirely
+    if not chart_github_links:
+        print("⚠️  No chart links provided, skipping visualization sheet")
+        return {
+            "spreadsheet_id": spreadsheet_id or "",
+            "sheet_name": sheet_name or "",
+            "url": (
+                f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}" if spreadsheet_id else ""
+            ),
+        }
+
+    from impactlens.clients.sheets_client import create_spreadsheet, cleanup_old_sheets
 
     # Read report metadata
     with open(report_path, "r", encoding="utf-8") as f:
@@ -80,9 +90,7 @@ def create_visualization_sheet(
         print(f"✓ Using existing spreadsheet: {spreadsheet_id}")
 
     # Always add timestamp to sheet name (consistent with other sheets)
-    import datetime
-
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
     sheet_name = f"{sheet_name} - {timestamp}"
 
     # Create new sheet
@@ -141,13 +149,10 @@ def create_visualization_sheet(
     else:  # PR
         not_visualized = "Total PRs Merged, Non-AI PRs, Claude/Cursor PRs, Total Lines/Files, etc."
 
-    metadata_lines = []
-    if generation_date:
-        metadata_lines.append(f"Generated: {generation_date}")
-    metadata_lines.append(f"Source Report: {source_report_filename}")
-    metadata_lines.append(f"Visualized Metrics: {num_charts} charts")
-    metadata_lines.append(
-        f"Not visualized: {not_visualized} (cumulative/count metrics less suitable for distribution analysis)"
+    metadata_lines = ((f"Generated: {generation_date}",) if generation_date else ()) + (
+        f"Source Report: {source_report_filename}",
+        f"Visualized Metrics: {num_charts} charts",
+        f"Not visualized: {not_visualized} (cumulative/count metrics less suitable for distribution analysis)",
     )
 
     metadata_text = "\n".join(metadata_lines)
@@ -272,6 +277,8 @@ Tips:
     num_columns = 2
     chart_height = 300  # Smaller height for better fit
     chart_width = 600  # Width per column
+    # Size arguments are loop-invariant, so only the URL is formatted per chart
+    image_formula_template = '=IMAGE("{}", 4, ' + f"{chart_height}, {chart_width})"
 
     for idx, chart_info in enumerate(chart_github_links):
         embed_url = chart_info["embedUrl"]
@@ -296,7 +303,7 @@ Tips:
                             "values": [
                                 {
                                     "userEnteredValue": {
-                                        "formulaValue": f'=IMAGE("{embed_url}", 4, {chart_height}, {chart_width})'
+                                        "formulaValue": image_formula_template.format(embed_url)
                                     },
                                 }
                             ]
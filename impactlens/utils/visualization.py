@@ -5,16 +5,36 @@ This module provides functions to generate box plots and line charts
 to visualize team metrics trends across different phases.
 """
 
+import base64
+import functools
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 try:
     import matplotlib
 
     matplotlib.use("Agg")  # Non-interactive backend for CI/server environments
-    import matplotlib.pyplot as plt
     import numpy as np
+    from matplotlib import font_manager
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    # Charts use plain-text labels and tiny paths, so skip mathtext parsing and
+    # LaTeX and let Agg simplify paths aggressively
+    matplotlib.rcParams.update(
+        {
+            "text.usetex": False,
+            "text.parse_math": False,
+            "path.simplify": True,
+            "path.simplify_threshold": 1.0,
+            "agg.path.chunksize": 10000,
+            "figure.max_open_warning": 0,
+        }
+    )
+    # Warm the font lookup cache once instead of on the first savefig
+    font_manager.fontManager.findfont("DejaVu Sans")
 
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
@@ -22,40 +42,122 @@ except ImportError:
     print("Warning: matplotlib not installed. Charts will not be generated.")
     print("Install with: pip install matplotlib")
 
+# Box plots need 3+ members to be meaningful (see the report notes)
+MIN_BOXPLOT_SAMPLES = 3
+
+# Charts each render worker process should get before a process pool pays off
+MIN_CHARTS_PER_WORKER = 4
+
+# PNG encoder settings: favour encode speed over file size
+PNG_SAVE_KWARGS = {"optimize": False, "compress_level": 1}
+
+# Characters of the unit suffixes on TSV cells (/d, d, %, h, x); all are
+# trailing, so a single rstrip removes them
+_UNIT_CHARS = "/d%hx"
+
+# Section name -> (header_line_idx, end_line_idx) within a combined report
+SectionIndex = Dict[str, Tuple[int, int]]
+
+
+def _index_sections(lines: Sequence[str]) -> SectionIndex:
+    """
+    Locate every "=== Section ===" block in a combined report in one pass.
+
+    Args:
+        lines: List of lines from the TSV file
+
+    Returns:
+        Dictionary mapping section name to (header_line_idx, end_line_idx),
+        where end_line_idx is the next section header or len(lines).
+    """
+    section_index: SectionIndex = {}
+    current_name = None
+    current_start = 0
+
+    for idx, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("=== ") and stripped.endswith(" ==="):
+            if current_name is not None:
+                section_index.setdefault(current_name, (current_start, idx))
+            current_name = stripped[4:-4]
+            current_start = idx
+
+    if current_name is not None:
+        section_index.setdefault(current_name, (current_start, len(lines)))
+
+    return section_index
+
+
+@functools.lru_cache(maxsize=16)
+def _read_and_index(
+    report_path: str, mtime_ns: int, size: int
+) -> Tuple[Tuple[str, ...], SectionIndex]:
+    """Read a combined report and index its sections (cached per path, mtime and size)."""
+    with open(report_path, "r", encoding="utf-8") as f:
+        lines = tuple(f.readlines())
+
+    return lines, _index_sections(lines)
+
+
+def read_combined_report(
+    report_path: str,
+) -> Tuple[Tuple[str, ...], SectionIndex]:
+    """
+    Read a combined report TSV together with its section index.
+
+    Results are cached, so chart and HTML generation for the same report share
+    a single read and scan; editing the file invalidates the cache via its
+    modification time and size.
+
+    Args:
+        report_path: Path to combined report TSV file
+
+    Returns:
+        Tuple of (lines, section_index); treat both as read-only
 
-def parse_combined_report_section(lines: List[str], section_name: str) -> Optional[Dict]:
+    Raises:
+        FileNotFoundError: If the report does not exist
+    """
+    st = os.stat(report_path)
+    return _read_and_index(report_path, st.st_mtime_ns, st.st_size)
+
+
+def parse_combined_report_section(
+    lines: Sequence[str],
+    section_name: str,
+    section_index: Optional[SectionIndex] = None,
+) -> Optional[Dict]:
     """
     Parse a section from combined report TSV format.
 
     Args:
         lines: List of lines from the TSV file
         section_name: Name of the section (e.g., "Daily Throughput")
+        section_index: Precomputed result of _index_sections(lines); pass it when
+                       parsing several sections of the same report to avoid rescanning
 
     Returns:
         Dictionary with structure:
         {
             'phases': ['Phase 1', 'Phase 2', ...],
-            'team': [val1, val2, ...],
-            'members': {
-                'Developer-1': [val1, val2, ...],
-                'Developer-2': [val1, val2, ...],
-            }
+            'team': array([val1, val2, ...]),
+            'member_names': ['Developer-1', 'Developer-2', ...],
+            'members_arr': array of shape (n_phases, n_members),
         }
+        Values are floats, with NaN for N/A or unparsable cells.
         Returns None if section not found or parsing fails.
     """
+    if section_index is None:
+        section_index = _index_sections(lines)
+
     # Find section header
-    section_header = f"=== {section_name} ==="
-    try:
-        # Try with newline first (most common)
-        start_idx = lines.index(section_header + "\n")
-    except ValueError:
-        try:
-            # Try without newline (in case it's the last line)
-            start_idx = lines.index(section_header)
-        except ValueError:
-            return None
+    if section_name not in section_index:
+        return None
+    start_idx, end_idx = section_index[section_name]
 
     # Parse column headers (Phase\tteam\tDeveloper-1\t...)
+    if start_idx + 1 >= end_idx:
+        return None
     header_line = lines[start_idx + 1]
     columns = header_line.strip().split("\t")
 
@@ -63,39 +165,34 @@ def parse_combined_report_section(lines: List[str], section_name: str) -> Option
         return None
 
     member_names = columns[2:]  # All columns after 'team'
-
-    # Parse data rows
-    data = {"phases": [], "team": [], "members": {name: [] for name in member_names}}
-
-    # Read until next section or end
-    idx = start_idx + 2
-    while idx < len(lines):
-        line = lines[idx].strip()
-
-        # Stop at next section or empty line
-        if line.startswith("===") or line == "":
+    n_values = len(member_names) + 1  # team + members
+
+    # The section schema is fixed (phase + n_values cells per row), so pad every
+    # row to that width up front: each row is then one split and one slice with
+    # no per-cell length checks, and all cells are converted in a single batch
+    row_padding = "\tN/A" * n_values
+    phases = []
+    cells = []
+    for line in lines[start_idx + 2 : end_idx]:
+        line = line.strip()
+
+        # Stop at empty line or a line that is not a data row
+        if line == "" or "\t" not in line:
             break
 
-        values = line.split("\t")
-        if len(values) < 2:
-            break
-
-        phase_name = values[0]
-        team_value = values[1]
-        member_values = values[2:]
+        phase, _, row_values = line.partition("\t")
+        phases.append(phase)
+        cells.extend((row_values + row_padding).split("\t")[:n_values])
 
-        data["phases"].append(phase_name)
-        data["team"].append(_parse_value(team_value))
-
-        for i, member_name in enumerate(member_names):
-            if i < len(member_values):
-                data["members"][member_name].append(_parse_value(member_values[i]))
-            else:
-                data["members"][member_name].append(None)
+    # One (phases x [team + members]) matrix; missing cells are NaN
+    values_arr = _parse_row(cells).reshape(len(phases), n_values)
 
-        idx += 1
-
-    return data
+    return {
+        "phases": phases,
+        "team": values_arr[:, 0],
+        "member_names": member_names,
+        "members_arr": values_arr[:, 1:],
+    }
 
 
 def _parse_value(value_str: str) -> Optional[float]:
@@ -111,8 +208,7 @@ def _parse_value(value_str: str) -> Optional[float]:
         return None
 
     # Remove units: /d, d, %, h, x
-    for unit in ["/d", "d", "%", "h", "x"]:
-        value_str = value_str.replace(unit, "")
+    value_str = value_str.rstrip(_UNIT_CHARS)
 
     try:
         return float(value_str)
@@ -120,6 +216,86 @@ def _parse_value(value_str: str) -> Optional[float]:
         return None
 
 
+def _parse_row(values: List[str]) -> "np.ndarray":
+    """
+    Parse a batch of TSV cells into a float array in one pass.
+
+    Units are stripped with a single rstrip per cell and the whole batch (all
+    cells of a report section) is converted with one ``astype`` call instead of
+    a ``float()`` per cell.
+
+    Returns:
+        Float array with NaN for N/A or invalid cells
+    """
+    cleaned = np.array(
+        ["nan" if (cell := v.strip().rstrip(_UNIT_CHARS)) in ("N/A", "") else cell for v in values]
+    )
+
+    try:
+        return cleaned.astype(np.float64)
+    except ValueError:
+        # Rare malformed cell: parse the whole batch cell by cell, so only the
+        # malformed cells become NaN
+        return np.array(
+            [np.nan if (v := _parse_value(cell)) is None else v for cell in values],
+            dtype=np.float64,
+        )
+
+
+def _compute_box_stats(values, label: str) -> Dict:
+    """
+    Compute box plot statistics for one phase, as expected by ``Axes.bxp``.
+
+    Mirrors matplotlib's default ``boxplot`` behaviour (linear percentiles,
+    whiskers at the furthest samples within 1.5 * IQR of the box).
+
+    Args:
+        values: Sample values for the phase (N/A values already removed)
+        label: Tick label for the box (phase name)
+
+    Returns:
+        Dictionary with med/q1/q3/whislo/whishi/fliers/label keys
+    """
+    arr = np.asarray(values, dtype=np.float64)
+
+    if arr.size == 0:
+        return {
+            "med": np.nan,
+            "q1": np.nan,
+            "q3": np.nan,
+            "whislo": np.nan,
+            "whishi": np.nan,
+            "fliers": arr,
+            "label": label,
+        }
+
+    q1 = np.percentile(arr, 25)
+    med = np.percentile(arr, 50)
+    q3 = np.percentile(arr, 75)
+    iqr = q3 - q1
+
+    # Whiskers extend to the most extreme samples still inside the fences
+    whislo = q1
+    inside_lo = arr[arr >= q1 - 1.5 * iqr]
+    if inside_lo.size > 0 and inside_lo.min() <= q1:
+        whislo = inside_lo.min()
+
+    whishi = q3
+    inside_hi = arr[arr <= q3 + 1.5 * iqr]
+    if inside_hi.size > 0 and inside_hi.max() >= q3:
+        whishi = inside_hi.max()
+
+    return {
+        "med": med,
+        "q1": q1,
+        "q3": q3,
+        "whislo": whislo,
+        "whishi": whishi,
+        "fliers": arr[(arr < whislo) | (arr > whishi)],
+        "label": label,
+    }
+
+
 def generate_boxplot(
     data: Dict, metric_name: str, output_path: str, unit: str = "", title_prefix: str = ""
 ) -> bool:
@@ -139,27 +315,98 @@ def generate_boxplot(
     if not MATPLOTLIB_AVAILABLE:
         return False
 
+    if not _has_plottable_data(data, metric_name):
+        return False
+
+    fig, ax = _new_chart_figure()
+
+    _draw_boxplot(ax, data, metric_name, unit)
+    _save_chart(fig, output_path)
+
+    return True
+
+
+def _new_chart_figure():
+    """
+    Create a single-plot chart figure on the Agg canvas.
+
+    Uses the object-oriented API directly, so no pyplot figure registry is
+    involved and nothing needs closing; the figure is freed with its last reference.
+    """
+    # Single plot, smaller size for compact display. Constrained layout fits
+    # labels during the draw itself, so no separate tight_layout() pass is needed.
+    fig = Figure(figsize=(8, 4.5), layout="constrained")
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+
+# Figure reused by _generate_boxplot_on_shared_figure() within one render worker
+_shared_chart_figure = None
+
+
+def _generate_boxplot_on_shared_figure(
+    data: Dict, metric_name: str, output_path: str, unit: str = "", title_prefix: str = ""
+) -> bool:
+    """
+    Same as generate_boxplot(), but redraws onto one figure reused across calls.
+
+    Skips per-chart figure construction and teardown. Only safe when a single
+    thread renders in this process, which both the serial path and the
+    process-pool workers guarantee.
+    """
+    global _shared_chart_figure
+
+    if not _has_plottable_data(data, metric_name):
+        return False
+
+    if _shared_chart_figure is None:
+        _shared_chart_figure, _ = _new_chart_figure()
+
+    ax = _shared_chart_figure.axes[0]
+    ax.clear()
+
+    _draw_boxplot(ax, data, metric_name, unit)
+    _save_chart(_shared_chart_figure, output_path)
+
+    return True
+
+
+def _close_shared_figure():
+    """Release the figure cached by _generate_boxplot_on_shared_figure()."""
+    global _shared_chart_figure
+
+    _shared_chart_figure = None
+
+
+def _has_plottable_data(data: Dict, metric_name: str) -> bool:
+    """Check that at least one phase has the 3+ samples a box plot needs."""
     if not data or not data["phases"]:
         print(f"No data available for {metric_name}")
         return False
 
+    samples_per_phase = np.count_nonzero(~np.isnan(data["members_arr"]), axis=1)
+    if samples_per_phase.max(initial=0) < MIN_BOXPLOT_SAMPLES:
+        print(f"Skipping {metric_name}: insufficient samples")
+        return False
+
+    return True
+
+
+def _draw_boxplot(ax, data: Dict, metric_name: str, unit: str) -> None:
+    """Draw the styled box plot for one metric onto an existing Axes."""
     # Prepare data for box plot
     phases = data["phases"]
 
-    # Collect member values for each phase (excluding None values)
-    member_distributions = []
-    for phase_idx in range(len(phases)):
-        phase_data = []
-        for member_name, values in data["members"].items():
-            if phase_idx < len(values) and values[phase_idx] is not None:
-                phase_data.append(values[phase_idx])
-        member_distributions.append(phase_data)
-
-    # Create figure with single plot (smaller size for compact display)
-    fig, ax = plt.subplots(1, 1, figsize=(8, 4.5))
+    # Collect member values for each phase (excluding N/A values)
+    member_distributions = [row[~np.isnan(row)] for row in data["members_arr"]]
 
     # === Box Plot ===
-    bp = ax.boxplot(member_distributions, labels=phases, patch_artist=True)
+    # Statistics are computed up front so matplotlib only has to draw them
+    box_stats = [
+        _compute_box_stats(phase_data, phase)
+        for phase_data, phase in zip(member_distributions, phases)
+    ]
+    bp = ax.bxp(box_stats, patch_artist=True, showfliers=True)
 
     # Customize box plot colors
     for patch in bp["boxes"]:
@@ -182,17 +429,31 @@ def generate_boxplot(
     ax.grid(True, alpha=0.3, axis="y")
     ax.tick_params(axis="x", rotation=15)
 
-    plt.tight_layout()
 
+def _save_chart(fig, output_path: str) -> None:
+    """Write a chart figure to disk."""
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    # Save figure with high DPI for better quality in Google Sheets
-    plt.savefig(output_path, dpi=95, bbox_inches="tight")
-    plt.close()
+    # Save figure with high DPI for better quality in Google Sheets.
+    # The figure's constrained layout already trims margins; bbox_inches="tight"
+    # would force a second render pass just to measure the bounding box.
+    # Fast zlib level: charts are small, so max compression saves little.
+    fig.savefig(output_path, dpi=95, pil_kwargs=PNG_SAVE_KWARGS)
 
     print(f"Chart saved: {output_path}")
-    return True
+
+
+# Read size for base64 streaming; a multiple of 3 bytes so no chunk except the
+# last one produces "=" padding in the middle of the output
+_BASE64_CHUNK_SIZE = 57 * 1024
+
+
+def _write_base64(src_path: str, out_file) -> None:
+    """Base64-encode a file into an open binary file, one chunk at a time."""
+    with open(src_path, "rb") as src:
+        while block := src.read(_BASE64_CHUNK_SIZE):
+            out_file.write(base64.b64encode(block))
 
 
 def generate_html_visualization_report(
@@ -209,12 +470,10 @@ def generate_html_visualization_report(
     Returns:
         Path to generated HTML file
     """
-    import base64
     from datetime import datetime
 
     # Read report metadata
-    with open(report_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+    lines, section_index = read_combined_report(report_path)
 
     # Extract title and metadata
     report_title = "Combined Report Visualization"
@@ -236,9 +495,7 @@ def generate_html_visualization_report(
         report_title = f"{report_type} Visualization Report"
 
     # Count actual metrics from report (count === sections)
-    total_metrics = sum(
-        1 for line in lines if line.strip().startswith("===") and line.strip().endswith("===")
-    )
+    total_metrics = len(section_index)
 
     # Prepare exclusion notes based on report type
     if report_type == "Jira":
@@ -454,29 +711,20 @@ def generate_html_visualization_report(
         <div class="charts-grid">
 """
 
-    # Add each chart as a section in grid
-    for chart_path in chart_files:
-        chart_name = Path(chart_path).stem.replace("_", " ").title()
-
-        # Read image and encode as base64 (embed in HTML)
-        with open(chart_path, "rb") as img_file:
-            img_data = base64.b64encode(img_file.read()).decode("utf-8")
-
-        html_content += f"""
+    # Chart markup around the streamed base64 payload
+    chart_open = """
             <div class="chart-section">
                 <div class="chart-container">
-                    <img src="data:image/png;base64,{img_data}" alt="{chart_name}">
+                    <img src="data:image/png;base64,"""
+    chart_close = """" alt="{chart_name}">
                 </div>
             </div>
 """
 
-    # Close grid
-    html_content += """
+    # Close grid and add footer
+    html_footer = """
         </div>
-"""
 
-    # Add footer
-    html_content += f"""
         <div class="footer">
             <p>Generated by ImpactLens | <a href="https://github.com/testcara/impactlens">GitHub</a></p>
             <p>For detailed metric explanations, see <a href="https://github.com/testcara/impactlens/blob/master/docs/METRICS_GUIDE.md">Metrics Guide</a></p>
@@ -486,9 +734,20 @@ def generate_html_visualization_report(
 </html>
 """
 
-    # Write HTML file
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    # Write HTML file, streaming each PNG's base64 straight into it so the
+    # images are never held in memory as one large concatenated string
+    with open(output_path, "wb") as f:
+        f.write(html_content.encode("utf-8"))
+
+        # Add each chart as a section in grid
+        for chart_path in chart_files:
+            chart_name = Path(chart_path).stem.replace("_", " ").title()
+
+            f.write(chart_open.encode("utf-8"))
+            _write_base64(chart_path, f)
+            f.write(chart_close.format(chart_name=chart_name).encode("utf-8"))
+
+        f.write(html_footer.encode("utf-8"))
 
     print(f"\nHTML visualization report saved: {output_path}")
     return output_path
@@ -590,10 +849,9 @@ def generate_charts_from_combined_report(
                 ("Avg Files Changed per PR", "files"),
             ]
 
-    # Read report file
+    # Read report file and locate all sections once (not rescanned per metric)
     try:
-        with open(report_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        lines, section_index = read_combined_report(report_path)
     except FileNotFoundError:
         print(f"Report file not found: {report_path}")
         return []
@@ -605,30 +863,47 @@ def generate_charts_from_combined_report(
             title_prefix = line.split(":", 1)[1].strip() + " - "
             break
 
-    generated_charts = []
-
-    # Generate chart for each metric
-    for metric_name, unit in metrics_config:
-        data = parse_combined_report_section(lines, metric_name)
-
-        if data is None:
-            print(f"Metric not found in report: {metric_name}")
-            continue
-
-        # Create safe filename
-        safe_name = metric_name.lower().replace(" ", "_").replace("(", "").replace(")", "")
-        output_path = os.path.join(output_dir, f"{safe_name}.png")
+    # Rendering is CPU-bound (Agg rasterization + PNG encode), so spread it over
+    # processes, but only when there are spare cores and each worker gets enough
+    # charts to pay for its startup; otherwise render in this process. The
+    # section index tells us up front how many charts there will be.
+    expected_charts = sum(1 for metric_name, _ in metrics_config if metric_name in section_index)
+    max_workers = min(os.cpu_count() or 1, expected_charts // MIN_CHARTS_PER_WORKER)
+    render_pool = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+
+    chart_paths = []
+    futures = []
+    results = []
+    try:
+        for metric_name, unit in metrics_config:
+            data = parse_combined_report_section(lines, metric_name, section_index)
+
+            if data is None:
+                print(f"Metric not found in report: {metric_name}")
+                continue
+
+            # Create safe filename
+            safe_name = metric_name.lower().replace(" ", "_").replace("(", "").replace(")", "")
+            output_path = os.path.join(output_dir, f"{safe_name}.png")
+            job = (data, metric_name, output_path, unit, title_prefix)
+            chart_paths.append(output_path)
+
+            if render_pool is not None:
+                # Submit as soon as the section is parsed, so workers render while
+                # the remaining sections are still being parsed
+                futures.append(render_pool.submit(_generate_boxplot_on_shared_figure, *job))
+            else:
+                results.append(_generate_boxplot_on_shared_figure(*job))
 
-        success = generate_boxplot(
-            data=data,
-            metric_name=metric_name,
-            output_path=output_path,
-            unit=unit,
-            title_prefix=title_prefix,
-        )
+        # Futures are collected in metrics_config order regardless of completion order
+        results.extend(future.result() for future in futures)
+    finally:
+        if render_pool is not None:
+            render_pool.shutdown()
+        else:
+            _close_shared_figure()
 
-        if success:
-            generated_charts.append(output_path)
+    generated_charts = [path for path, generated in zip(chart_paths, results) if generated]
 
     print(f"\nGenerated {len(generated_charts)} charts in {output_dir}")
 
@@ -4,14 +4,15 @@ Workflow utilities for report generation scripts.
 This module contains shared functions used by Jira and GitHub report generation workflows.
 """
 
+import errno
 import os
+import stat
 import sys
-import glob
-import subprocess
-import yaml
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Any
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from impactlens.utils.logger import Colors, set_log_level
 
@@ -21,6 +22,48 @@ from impactlens.utils.logger import Colors, set_log_level
 # which is required for Google Sheets upload
 MIN_PHASES_FOR_COMPARISON = 1
 
+# Project settings keys that override environment variables: (config_key, env_var)
+PROJECT_SETTINGS_ENV_MAPPINGS = (
+    ("jira_url", "JIRA_URL"),
+    ("jira_project_key", "JIRA_PROJECT_KEY"),
+    ("git_url", "GIT_URL"),
+    ("git_repo_owner", "GIT_REPO_OWNER"),
+    ("git_repo_name", "GIT_REPO_NAME"),
+)
+
+
+@lru_cache(maxsize=32)
+def _read_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file once per (path, mtime, size); see read_yaml_config."""
+    import yaml
+
+    # Use the libyaml-backed loader when PyYAML was built with it
+    yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(Path(path_str).read_bytes(), Loader=yaml_loader)
+
+
+def read_yaml_config(path: Path) -> Any:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    The same config file is read by several helpers during one run, so the
+    parse is cached on (path, mtime, size); the size catches rewrites that land
+    within the filesystem's mtime granularity. The returned object is shared
+    between callers and must be treated as read-only.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content (None for an empty file)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the file is not valid YAML (errors are not cached)
+    """
+    st = path.stat()
+    return _read_yaml_cached(str(path), st.st_mtime_ns, st.st_size)
+
 
 def apply_project_settings_to_env(
     project_settings: Dict[str, Any], root_config: Optional[Dict[str, Any]] = None
@@ -43,24 +86,27 @@ def apply_project_settings_to_env(
         # Now os.environ["GIT_REPO_NAME"] == "konflux-ui"
         # Now os.environ["GOOGLE_SPREADSHEET_ID"] == "1ABC..."
     """
-    env_mappings = {
-        "jira_url": "JIRA_URL",
-        "jira_project_key": "JIRA_PROJECT_KEY",
-        "git_url": "GIT_URL",
-        "git_repo_owner": "GIT_REPO_OWNER",
-        "git_repo_name": "GIT_REPO_NAME",
-    }
-
-    for config_key, env_var in env_mappings.items():
+    env_updates = {}
+    for config_key, env_var in PROJECT_SETTINGS_ENV_MAPPINGS:
         config_value = project_settings.get(config_key)
         if config_value:  # Config has value, override environment variable
-            os.environ[env_var] = str(config_value)
+            env_updates[env_var] = str(config_value)
 
     # Handle root-level google_spreadsheet_id
     if root_config:
         google_spreadsheet_id = root_config.get("google_spreadsheet_id")
         if google_spreadsheet_id:
-            os.environ["GOOGLE_SPREADSHEET_ID"] = str(google_spreadsheet_id)
+            env_updates["GOOGLE_SPREADSHEET_ID"] = str(google_spreadsheet_id)
+
+    # Apply in one update, skipping variables that already hold the value
+    # (load_config_file runs this for every config it loads)
+    os.environ.update(
+        {
+            env_var: value
+            for env_var, value in env_updates.items()
+            if os.environ.get(env_var) != value
+        }
+    )
 
 
 def get_email_anonymous_id_enabled(config_path: Path) -> bool:
@@ -83,24 +129,35 @@ def get_email_anonymous_id_enabled(config_path: Path) -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """
     Get the project root directory by searching for marker files.
 
     Searches upward from current file for .git directory or other markers.
+    The result is cached for the lifetime of the process.
     """
     current = Path(__file__).resolve()
 
-    # Search upward for project markers
+    # Search upward for project markers, reading each directory once
     for parent in [current, *current.parents]:
+        try:
+            with os.scandir(parent) as entries:
+                names = {entry.name: entry for entry in entries}
+        except OSError:
+            # Not a directory (the module file itself) or not readable
+            continue
+
         # Check for common project root markers
-        if any(
-            [
-                (parent / ".git").exists(),
-                (parent / "pyproject.toml").exists(),
-                (parent / "setup.py").exists(),
-                (parent / "requirements.txt").exists() and (parent / "impactlens").is_dir(),
-            ]
+        if (
+            ".git" in names
+            or "pyproject.toml" in names
+            or "setup.py" in names
+            or (
+                "requirements.txt" in names
+                and "impactlens" in names
+                and names["impactlens"].is_dir()
+            )
         ):
             return parent
 
@@ -108,7 +165,9 @@ def get_project_root() -> Path:
     return Path.cwd()
 
 
-def merge_configs(default_config: Dict[str, Any], custom_config: Dict[str, Any]) -> Dict[str, Any]:
+def merge_configs(
+    default_config: Dict[str, Any], custom_config: Dict[str, Any], copy: bool = True
+) -> Dict[str, Any]:
     """
     Merge custom configuration with default configuration.
 
@@ -118,18 +177,30 @@ def merge_configs(default_config: Dict[str, Any], custom_config: Dict[str, Any])
     Args:
         default_config: Default configuration dict
         custom_config: Custom configuration dict (overrides defaults)
+        copy: If False, default_config itself may be returned when custom_config
+              overrides nothing (the caller must not mutate the result)
 
     Returns:
         Merged configuration dict
     """
-    merged = default_config.copy()
+    # Only override if value is provided
+    overrides = {key: value for key, value in custom_config.items() if value is not None}
+
+    # Nothing to merge on one side: skip building the combined dict
+    if not overrides:
+        return dict(default_config) if copy else default_config
+    if not default_config:
+        return overrides
 
-    # Override with custom values
-    for key, value in custom_config.items():
-        if value is not None:  # Only override if value is provided
-            merged[key] = value
+    return default_config | overrides
 
-    return merged
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it does not exist."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 
 def validate_config_file(
@@ -153,13 +224,14 @@ def validate_config_file(
     """
     # Validate custom config file if specified (it must exist)
     if custom_config_path:
-        if not custom_config_path.exists():
+        custom_stat = _stat_or_none(custom_config_path)
+        if custom_stat is None:
             print(
                 f"{Colors.RED}Error: Specified {config_type} file does not exist: {custom_config_path}{Colors.NC}"
             )
             print(f"{Colors.YELLOW}Please check the path and try again.{Colors.NC}")
             return False
-        if not custom_config_path.is_file():
+        if not stat.S_ISREG(custom_stat.st_mode):
             print(
                 f"{Colors.RED}Error: Specified {config_type} path is not a file: {custom_config_path}{Colors.NC}"
             )
@@ -170,7 +242,7 @@ def validate_config_file(
         return True
 
     # No custom config provided, so default config must exist
-    if not default_config_path.exists():
+    if _stat_or_none(default_config_path) is None:
         print(
             f"{Colors.RED}Error: Default {config_type} file not found: {default_config_path}{Colors.NC}"
         )
@@ -271,48 +343,46 @@ def load_config_file(
         FileNotFoundError: If required config file doesn't exist
         ValueError: If config format is invalid
     """
+    import yaml
+
     config = None
 
     # Case 1 & 2: Custom config provided
     if custom_config_path and custom_config_path.exists():
         # Load custom config
         try:
-            with open(custom_config_path, "r") as f:
-                custom_config = yaml.safe_load(f)
+            custom_config = read_yaml_config(custom_config_path)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML format in {custom_config_path}: {e}")
 
         if not custom_config:
             raise ValueError(f"Empty config file: {custom_config_path}")
 
-        # Case 1: If default config also exists, merge them (custom overrides default)
-        if config_path.exists():
-            try:
-                with open(config_path, "r") as f:
-                    default_config = yaml.safe_load(f)
-                if default_config:
-                    config = merge_configs(default_config, custom_config)
-                    print(
-                        f"[INFO] Merged custom config {custom_config_path} with default {config_path}"
-                    )
-                else:
-                    config = custom_config
-            except yaml.YAMLError as e:
-                print(f"[WARNING] Invalid YAML in default config {config_path}: {e}")
-                config = custom_config
-        else:
+        # Case 1: If default config also exists, merge them (custom overrides default).
+        # The default comes straight from the parse cache (no separate exists()
+        # probe) and merge_configs builds a fresh dict, so nothing is copied twice.
+        try:
+            default_config = read_yaml_config(config_path)
+        except FileNotFoundError:
             # Case 2: Only custom config exists, use it directly
-            config = custom_config
+            default_config = None
             print(f"[INFO] Using custom config: {custom_config_path}")
+        except yaml.YAMLError as e:
+            default_config = None
+            print(f"[WARNING] Invalid YAML in default config {config_path}: {e}")
+
+        if default_config:
+            config = merge_configs(default_config, custom_config, copy=False)
+            print(f"[INFO] Merged custom config {custom_config_path} with default {config_path}")
+        else:
+            config = custom_config
 
     # Case 3: No custom config, use default
     else:
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
-
         try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
+            config = read_yaml_config(config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_path}")
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML format in {config_path}: {e}")
 
@@ -331,14 +401,13 @@ def load_config_file(
     root_configs = {}
 
     # Extract and parse phases
-    phases = []
-    if "phases" in config and config["phases"]:
-        for phase in config["phases"]:
-            name = phase.get("name", "")
-            start = phase.get("start", "")
-            end = phase.get("end", "")
-            if name and start and end:
-                phases.append((name, start, end))
+    phases = [
+        (name, start, end)
+        for phase in config.get("phases") or ()
+        if (name := phase.get("name"))
+        and (start := phase.get("start"))
+        and (end := phase.get("end"))
+    ]
 
     if not phases:
         raise ValueError(f"No valid phases found in {config_path}")
@@ -360,6 +429,15 @@ def load_config_file(
     return project_settings, root_configs
 
 
+def _expand_to_phases(config_value, n_phases: int) -> list:
+    """Expand a member's leave_days/capacity setting to one value per phase (missing -> 0)."""
+    if isinstance(config_value, list):
+        values = config_value[:n_phases]
+        return values + [0] * (n_phases - len(values))
+    # Single value, used for all phases
+    return [config_value] * n_phases
+
+
 def aggregate_member_values_for_phases(
     config_file: Path, phases: list, author: Optional[str] = None
 ) -> tuple:
@@ -416,32 +494,19 @@ def aggregate_member_values_for_phases(
                 break
     else:
         # Team report: aggregate all members' values
-        # Initialize lists for each phase
-        leave_days_list = [0.0] * len(phases)
-        capacity_list = [0.0] * len(phases)
+        # One row per member, one value per phase; per-phase totals are column sums
+        n_phases = len(phases)
+        leave_rows = [
+            _expand_to_phases(details.get("leave_days", 0), n_phases)
+            for details in members_details.values()
+        ]
+        capacity_rows = [
+            _expand_to_phases(details.get("capacity", 1.0), n_phases)
+            for details in members_details.values()
+        ]
 
-        for member_id, details in members_details.items():
-            # Process leave_days
-            leave_days_config = details.get("leave_days", 0)
-            if isinstance(leave_days_config, list):
-                for i, ld in enumerate(leave_days_config):
-                    if i < len(leave_days_list):
-                        leave_days_list[i] += ld
-            else:
-                # Single value, add to all phases
-                for i in range(len(phases)):
-                    leave_days_list[i] += leave_days_config
-
-            # Process capacity
-            capacity_config = details.get("capacity", 1.0)
-            if isinstance(capacity_config, list):
-                for i, cap in enumerate(capacity_config):
-                    if i < len(capacity_list):
-                        capacity_list[i] += cap
-            else:
-                # Single value, add to all phases
-                for i in range(len(phases)):
-                    capacity_list[i] += capacity_config
+        leave_days_list = [sum((row[i] for row in leave_rows), 0.0) for i in range(n_phases)]
+        capacity_list = [sum((row[i] for row in capacity_rows), 0.0) for i in range(n_phases)]
 
     return leave_days_list, capacity_list
 
@@ -473,11 +538,12 @@ def load_members_from_yaml(config_path: Path):
     Raises:
         FileNotFoundError: If config file doesn't exist
     """
+    import yaml
+
     if not config_path.exists():
         return {}
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = read_yaml_config(config_path)
     except yaml.YAMLError:
         return {}
 
@@ -499,6 +565,41 @@ def load_members_from_yaml(config_path: Path):
     return members_details
 
 
+def load_member_email_index(config_path: Path) -> Dict[str, Optional[str]]:
+    """
+    Map each member's git_username to their email (None if not configured).
+
+    Built once per config file version, so repeated username → email lookups
+    are dict hits instead of scans over all members. If two members share a
+    git_username, the first one in the config wins.
+
+    Args:
+        config_path: Path to YAML configuration file
+
+    Returns:
+        Dict mapping git_username to email; empty if the config doesn't exist.
+        The dict is shared between callers and must be treated as read-only.
+    """
+    try:
+        st = config_path.stat()
+    except OSError:
+        return {}
+    return _load_member_email_index_cached(str(config_path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=16)
+def _load_member_email_index_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> Dict[str, Optional[str]]:
+    """Build the git_username → email index once per (path, mtime, size)."""
+    index = {}
+    for member_info in load_members_from_yaml(Path(path_str)).values():
+        git_username = member_info.get("git_username")
+        if git_username and git_username not in index:
+            index[git_username] = member_info.get("email")
+    return index
+
+
 def cleanup_old_reports(reports_dir: Path, identifier: str, report_type: str) -> None:
     """
     Clean up old report files for a given identifier.
@@ -508,34 +609,44 @@ def cleanup_old_reports(reports_dir: Path, identifier: str, report_type: str) ->
         identifier: User identifier or "general"
         report_type: "jira" or "pr"
     """
-    reports_dir.mkdir(parents=True, exist_ok=True)
-
-    if report_type == "pr":
-        patterns = [
-            f"pr_metrics_{identifier}_*.json",
-            f"pr_report_{identifier}_*.txt",
-            f"pr_comparison_{identifier}_*.tsv",
-        ]
-        # Also clean combined reports for the "general" identifier (team report)
-        if identifier == "general":
-            patterns.append(f"combined_pr_report_*.tsv")
-    elif report_type == "jira":
-        patterns = [
-            f"jira_metrics_{identifier}_*.json",
-            f"jira_report_{identifier}_*.txt",
-            f"jira_comparison_{identifier}_*.tsv",
-        ]
-        # Also clean combined reports for the "general" identifier (team report)
-        if identifier == "general":
-            patterns.append(f"combined_jira_report_*.tsv")
-    else:
+    if report_type not in ("pr", "jira"):
         raise ValueError(f"Unknown report type: {report_type}")
 
+    # (prefix, suffix) pairs, equivalent to globbing "<prefix>*<suffix>"
+    patterns = [
+        (f"{report_type}_metrics_{identifier}_", ".json"),
+        (f"{report_type}_report_{identifier}_", ".txt"),
+        (f"{report_type}_comparison_{identifier}_", ".tsv"),
+    ]
+    # Also clean combined reports for the "general" identifier (team report)
+    if identifier == "general":
+        patterns.append((f"combined_{report_type}_report_", ".tsv"))
+
+    # Match every pattern in a single directory pass instead of one glob per pattern
     removed_count = 0
-    for pattern in patterns:
-        for file_path in reports_dir.glob(pattern):
-            file_path.unlink()
-            removed_count += 1
+    try:
+        entries = os.scandir(reports_dir)
+    except FileNotFoundError:
+        # First run: nothing to clean up, just create the directory
+        reports_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not any(
+                    name.startswith(prefix) and name.endswith(suffix) for prefix, suffix in patterns
+                ):
+                    continue
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    continue  # Already removed by a concurrent cleanup
+                except OSError as e:
+                    if e.errno != errno.EBUSY:
+                        raise
+                    print(f"{Colors.YELLOW}  ⚠ Skipping busy file: {name}{Colors.NC}")
+                    continue
+                removed_count += 1
 
     print(f"{Colors.GREEN}  ✓ Removed {removed_count} old report files for {identifier}{Colors.NC}")
 
@@ -560,30 +671,85 @@ def extract_sheet_prefix(config_path: Optional[Path]) -> str:
     if not config_path:
         return ""
 
-    # Convert to Path if string
-    if isinstance(config_path, str):
-        config_path = Path(config_path)
+    # Make the path absolute (abspath folds ".." without resolving symlinks)
+    return _extract_sheet_prefix_cached(os.path.abspath(config_path))
+
+
+@lru_cache(maxsize=128)
+def _extract_sheet_prefix_cached(abs_path: str) -> str:
+    """Extract the sheet prefix from an absolute path; see extract_sheet_prefix."""
+    parts = Path(abs_path).parts
+
+    # Always return the first directory after the innermost 'config/'
+    # Examples:
+    #   - config/simple-team/jira_report_config.yaml → return "simple-team"
+    #   - config/test-integration-ci/test-ci-team/ → return "test-integration-ci"
+    #   - config/test-aggregation-ci/aggregation_config.yaml → return "test-aggregation-ci"
+    #   - /home/me/config/repo/config/team/ → return "team" (scan right to left)
+    for index in range(len(parts) - 2, -1, -1):
+        if parts[index] == "config":
+            return parts[index + 1]
+
+    return ""
+
+
+def _run_upload_in_process(upload_args: List[str]) -> bool:
+    """
+    Run the upload_to_sheets script in the current interpreter.
 
-    # Get absolute path and resolve
-    config_path = config_path.resolve()
+    Args:
+        upload_args: Command-line arguments for upload_to_sheets
 
-    # Find 'config' in path
-    parts = config_path.parts
+    Returns:
+        True if the upload succeeded, False otherwise (error details are
+        printed by the upload script itself)
+    """
     try:
-        config_index = parts.index("config")
+        from impactlens.scripts.upload_to_sheets import main as upload_main
 
-        # Always return the first directory after 'config/'
-        # Examples:
-        #   - config/simple-team/jira_report_config.yaml → return "simple-team"
-        #   - config/test-integration-ci/test-ci-team/ → return "test-integration-ci"
-        #   - config/test-aggregation-ci/aggregation_config.yaml → return "test-aggregation-ci"
-        if config_index + 1 < len(parts):
-            return parts[config_index + 1]
+        upload_main(upload_args)
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            print(f"{Colors.RED}   ⚠ Upload failed: exit code {e.code}{Colors.NC}")
+            return False
+    except Exception as e:
+        print(f"{Colors.RED}   ⚠ Upload failed: {e}{Colors.NC}")
+        return False
+    return True
 
-    except (ValueError, IndexError):
-        pass
 
-    return ""
+def _run_upload_subprocess(upload_args: List[str]) -> bool:
+    """
+    Run the upload_to_sheets script in a separate Python process.
+
+    Args:
+        upload_args: Command-line arguments for upload_to_sheets
+
+    Returns:
+        True if the upload succeeded, False otherwise
+    """
+    import subprocess
+
+    cmd = [sys.executable, "-m", "impactlens.scripts.upload_to_sheets", *upload_args]
+
+    # Let the upload script's stdout stream straight to ours; only stderr is
+    # captured, to be shown as error details if the upload fails
+    sys.stdout.flush()
+    try:
+        subprocess.run(cmd, check=True, stderr=subprocess.PIPE, text=True)
+        return True
+    except subprocess.CalledProcessError as e:
+        lines = [f"{Colors.RED}   ⚠ Upload failed: {e}{Colors.NC}"]
+        # Print stderr to show actual error details
+        if e.stderr:
+            lines.append(f"{Colors.RED}   Error details (stderr):{Colors.NC}")
+            lines.append(e.stderr)
+        else:
+            lines.append(
+                f"{Colors.RED}   No error output captured. Exit code: {e.returncode}{Colors.NC}"
+            )
+        print("\n".join(lines))
+        return False
 
 
 def upload_to_google_sheets(
@@ -620,11 +786,14 @@ def upload_to_google_sheets(
     # Skip upload if requested
     if skip_upload:
         if show_manual_instructions:
-            print(f"{Colors.BLUE}⏭️  Skipping upload (--no-upload specified){Colors.NC}")
-            print()
-            print("📤 To upload later:")
-            print(f"  python3 -m impactlens.scripts.upload_to_sheets --report {report_file}")
-            print()
+            lines = [
+                f"{Colors.BLUE}⏭️  Skipping upload (--no-upload specified){Colors.NC}",
+                "",
+                "📤 To upload later:",
+                f"  python3 -m impactlens.scripts.upload_to_sheets --report {report_file}",
+                "",
+            ]
+            print("\n".join(lines))
         return True
 
     credentials = os.getenv("GOOGLE_CREDENTIALS_FILE")
@@ -633,18 +802,12 @@ def upload_to_google_sheets(
     if credentials and spreadsheet_id:
         print(f"{Colors.YELLOW}📤 Uploading to Google Sheets...{Colors.NC}")
 
-        # Build command with --config if provided
-        cmd = [
-            sys.executable,
-            "-m",
-            "impactlens.scripts.upload_to_sheets",
-            "--report",
-            str(report_file),
-        ]
+        # Build upload arguments with --config if provided
+        upload_args = ["--report", str(report_file)]
 
         # Add --config parameter if config_path is provided
         if config_path:
-            cmd.extend(["--config", str(config_path)])
+            upload_args.extend(["--config", str(config_path)])
 
             # Check if replace_existing_reports is enabled in config
             try:
@@ -653,19 +816,19 @@ def upload_to_google_sheets(
                 if config_path.is_dir():
                     # If it's a directory, try to find a config file
                     # Try jira_report_config.yaml first, then pr_report_config.yaml
-                    for candidate in [
+                    # (one directory listing instead of probing each candidate)
+                    names = set(os.listdir(config_path))
+                    for candidate in (
                         "jira_report_config.yaml",
                         "pr_report_config.yaml",
                         "aggregation_config.yaml",
-                    ]:
-                        candidate_path = config_path / candidate
-                        if candidate_path.exists():
-                            config_file_to_read = candidate_path
+                    ):
+                        if candidate in names:
+                            config_file_to_read = config_path / candidate
                             break
 
                 # Read config file
-                with open(config_file_to_read, "r") as f:
-                    config = yaml.safe_load(f)
+                config = read_yaml_config(config_file_to_read)
 
                 # Read replace_existing_reports from root level (consistent across all config types)
                 replace_existing = (
@@ -673,57 +836,73 @@ def upload_to_google_sheets(
                 )
 
                 if replace_existing:
-                    cmd.append("--replace-existing")
+                    upload_args.append("--replace-existing")
             except Exception:
                 pass  # If config load fails, skip replace-existing flag
 
-        try:
-            result = subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            # Print stdout from upload script
-            if result.stdout:
-                print(result.stdout, end="")
+        # Run the upload script in-process by default; set IMPACTLENS_UPLOAD_SUBPROCESS
+        # to run it in a separate interpreter instead
+        if os.getenv("IMPACTLENS_UPLOAD_SUBPROCESS"):
+            uploaded = _run_upload_subprocess(upload_args)
+        else:
+            uploaded = _run_upload_in_process(upload_args)
+
+        if uploaded:
             print(f"{Colors.GREEN}   ✓ Upload successful{Colors.NC}")
             print()
             return True
-        except subprocess.CalledProcessError as e:
-            print(f"{Colors.RED}   ⚠ Upload failed: {e}{Colors.NC}")
-            # Print stderr to show actual error details
-            if e.stderr:
-                print(f"{Colors.RED}   Error details (stderr):{Colors.NC}")
-                print(e.stderr)
-            # Also print stdout in case error is there
-            if e.stdout:
-                print(f"{Colors.RED}   Output (stdout):{Colors.NC}")
-                print(e.stdout)
-            if not e.stderr and not e.stdout:
-                print(
-                    f"{Colors.RED}   No error output captured. Exit code: {e.returncode}{Colors.NC}"
-                )
-            if show_manual_instructions:
-                print("   You can upload manually:")
-                print(f"   python3 -m impactlens.scripts.upload_to_sheets --report {report_file}")
-            print()
-            return False
-    else:
+
+        lines = []
         if show_manual_instructions:
-            print(f"{Colors.BLUE}Google Sheets upload not configured (optional){Colors.NC}")
-            print(
-                "You can open this file in Google Sheets manually, or configure automatic upload:"
+            lines.append("   You can upload manually:")
+            lines.append(
+                f"   python3 -m impactlens.scripts.upload_to_sheets --report {report_file}"
             )
-            print("  export GOOGLE_CREDENTIALS_FILE=/path/to/credentials.json")
-            print("  export GOOGLE_SPREADSHEET_ID=your_spreadsheet_id")
-            print()
-            print("Or upload manually:")
-            print(f"  python3 -m impactlens.scripts.upload_to_sheets --report {report_file}")
-            print()
+        lines.append("")
+        print("\n".join(lines))
+        return False
+    else:
+        if show_manual_instructions:
+            lines = [
+                f"{Colors.BLUE}Google Sheets upload not configured (optional){Colors.NC}",
+                "You can open this file in Google Sheets manually, or configure automatic upload:",
+                "  export GOOGLE_CREDENTIALS_FILE=/path/to/credentials.json",
+                "  export GOOGLE_SPREADSHEET_ID=your_spreadsheet_id",
+                "",
+                "Or upload manually:",
+                f"  python3 -m impactlens.scripts.upload_to_sheets --report {report_file}",
+                "",
+            ]
+            print("\n".join(lines))
         return False
 
 
+def _find_latest_report(reports_dir: Path, prefix: str, suffix: str) -> Optional[Path]:
+    """
+    Find the most recently modified file matching "<prefix>*<suffix>".
+
+    Scans the directory once and keeps the running newest entry, so each
+    candidate is stat'ed once and nothing is sorted.
+
+    Returns:
+        Path to the newest matching file, or None if there is none
+    """
+    latest = None
+    latest_mtime = None
+    try:
+        with os.scandir(reports_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith(suffix):
+                    mtime = entry.stat().st_mtime
+                    if latest_mtime is None or mtime > latest_mtime:
+                        latest, latest_mtime = entry.path, mtime
+    except FileNotFoundError:
+        return None
+
+    return Path(latest) if latest else None
+
+
 def find_latest_comparison_report(
     reports_dir: Path, identifier: str, report_type: str
 ) -> Optional[Path]:
@@ -738,20 +917,10 @@ def find_latest_comparison_report(
     Returns:
         Path to latest report or None
     """
-    if report_type == "jira":
-        pattern = f"jira_comparison_{identifier}_*.tsv"
-    elif report_type == "pr":
-        pattern = f"pr_comparison_{identifier}_*.tsv"
-    else:
-        return None
-
-    files = list(reports_dir.glob(pattern))
-    if not files:
+    if report_type not in ("jira", "pr"):
         return None
 
-    # Sort by modification time, newest first
-    files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return files[0]
+    return _find_latest_report(reports_dir, f"{report_type}_comparison_{identifier}_", ".tsv")
 
 
 def find_latest_phase_report(
@@ -768,20 +937,10 @@ def find_latest_phase_report(
     Returns:
         Path to latest report or None
     """
-    if report_type == "jira":
-        pattern = f"jira_metrics_{identifier}_*.json"
-    elif report_type == "pr":
-        pattern = f"pr_metrics_{identifier}_*.json"
-    else:
+    if report_type not in ("jira", "pr"):
         return None
 
-    files = list(reports_dir.glob(pattern))
-    if not files:
-        return None
-
-    # Sort by modification time, newest first
-    files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-    return files[0]
+    return _find_latest_report(reports_dir, f"{report_type}_metrics_{identifier}_", ".json")
 
 
 def should_generate_comparison(phases: List) -> bool:
@@ -912,7 +1071,54 @@ def load_members_emails(members_file: Path) -> List[str]:
     Returns:
         List of team member emails
     """
-    return list(load_members_from_yaml(members_file).keys())
+    return _load_member_ids(members_file)
+
+
+def _load_member_ids(config_path: Path) -> List[str]:
+    """
+    Load team member identifiers (email, else git_username) from a YAML config.
+
+    Same identifiers, in the same order, as the keys of load_members_from_yaml,
+    without building the per-member details dicts.
+    """
+    import yaml
+
+    if not config_path.exists():
+        return []
+    try:
+        config = read_yaml_config(config_path)
+    except yaml.YAMLError:
+        return []
+
+    if not config or "members" not in config:
+        return []
+
+    # dict.fromkeys drops duplicates while keeping first-seen order
+    identifiers = (
+        member.get("email") or member.get("git_username")
+        for member in config["members"]
+        if isinstance(member, dict)
+    )
+    return list(dict.fromkeys(identifier for identifier in identifiers if identifier))
+
+
+def _build_member_report_cmd(
+    member: str, report_type: str, extra_args: Optional[List[str]] = None
+) -> Optional[List[str]]:
+    """Build the report CLI command for one member, or None for an unknown report type."""
+    args = [sys.executable, "-m"]
+
+    if report_type == "jira":
+        args.extend(["impactlens.cli.generate_jira_report", member])
+    elif report_type == "pr":
+        args.extend(["impactlens.cli.generate_pr_report", member])
+    else:
+        return None
+
+    if extra_args:
+        args.extend(extra_args)
+
+    return args
 
 
 def run_report_for_member(
@@ -930,21 +1136,58 @@ def run_report_for_member(
     Returns:
         True if successful, False otherwise
     """
-    args = [sys.executable, "-m"]
+    import subprocess
 
-    if report_type == "jira":
-        args.extend(["impactlens.cli.generate_jira_report", member])
-    elif report_type == "pr":
-        args.extend(["impactlens.cli.generate_pr_report", member])
-    else:
+    args = _build_member_report_cmd(member, report_type, extra_args)
+    if args is None:
         return False
 
-    if extra_args:
-        args.extend(extra_args)
-
     try:
         subprocess.run(args, check=True)
         return True
     except subprocess.CalledProcessError:
         print(f"{Colors.RED}  ✗ Failed to generate report for {member}{Colors.NC}")
         return False
+
+
+def run_member_commands(commands: Dict[str, List[str]], max_workers: int = 8) -> Dict[str, bool]:
+    """
+    Run per-member report commands concurrently.
+
+    Each member report is a separate subprocess that mostly waits on the
+    Jira/GitHub APIs, so they run on a thread pool. Output of each member is
+    captured and printed as one block when that member finishes, so reports
+    don't interleave.
+
+    Args:
+        commands: Dict mapping member identifier to its command line
+        max_workers: Maximum number of reports generated at the same time
+
+    Returns:
+        Dict mapping member to True if successful, False otherwise
+    """
+    import subprocess
+
+    results = {member: False for member in commands}
+    if not commands:
+        return results
+
+    print_lock = threading.Lock()
+
+    def run_one(member: str) -> bool:
+        result = subprocess.run(commands[member], capture_output=True, text=True)
+        with print_lock:
+            if result.stdout:
+                print(result.stdout, end="")
+            if result.returncode != 0:
+                if result.stderr:
+                    print(result.stderr, end="", file=sys.stderr)
+                print(f"{Colors.RED}  ✗ Failed to generate report for {member}{Colors.NC}")
+        return result.returncode == 0
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(commands)))) as executor:
+        futures = {executor.submit(run_one, member): member for member in commands}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    return results
@@ -0,0 +1,30 @@
+"""Shared pytest fixtures."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def make_response():
+    """
+    Factory for mocked HTTP responses.
+
+    The JSON body is served through both .json() and .content, so the mock works
+    whether or not orjson is installed. Pass raises to make raise_for_status() fail.
+    """
+
+    def _make_response(json_body=None, status=200, raises=None, text=""):
+        response = Mock()
+        response.status_code = status
+        response.ok = 200 <= status < 300
+        response.text = text
+        body = {} if json_body is None else json_body
+        response.json.return_value = body
+        response.content = json.dumps(body).encode()
+        if raises is not None:
+            response.raise_for_status.side_effect = raises
+        return response
+
+    return _make_response
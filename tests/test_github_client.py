@@ -2,10 +2,16 @@
 
 import os
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 from impactlens.clients.github_client import GitHubClient
 
 
+@pytest.fixture
+def client():
+    """GitHubClient for the mocked owner/repo."""
+    return GitHubClient(token="token", repo_owner="owner", repo_name="repo")
+
+
 class TestGitHubClient:
     """Test cases for GitHubClient class."""
 
@@ -43,122 +49,135 @@ class TestGitHubClient:
             with pytest.raises(ValueError, match="Repository owner and name are required"):
                 GitHubClient(token="token")
 
-    @patch("impactlens.clients.github_client.requests.get")
-    def test_fetch_merged_prs_success(self, mock_get):
+    @patch("requests.Session.get")
+    def test_fetch_merged_prs_success(self, mock_get, client, make_response):
         """Test fetching merged PRs successfully."""
         # Mock first page with one PR
-        mock_response_page1 = Mock()
-        mock_response_page1.status_code = 200
-        mock_response_page1.json.return_value = [
-            {
-                "number": 1,
-                "title": "Test PR",
-                "user": {"login": "testuser"},
-                "merged_at": "2024-10-15T10:00:00Z",
-                "created_at": "2024-10-14T10:00:00Z",
-                "updated_at": "2024-10-15T10:00:00Z",
-            }
-        ]
+        mock_response_page1 = make_response(
+            [
+                {
+                    "number": 1,
+                    "title": "Test PR",
+                    "user": {"login": "testuser"},
+                    "merged_at": "2024-10-15T10:00:00Z",
+                    "created_at": "2024-10-14T10:00:00Z",
+                    "updated_at": "2024-10-15T10:00:00Z",
+                }
+            ]
+        )
 
         # Mock second page (empty to end pagination)
-        mock_response_page2 = Mock()
-        mock_response_page2.status_code = 200
-        mock_response_page2.json.return_value = []
+        mock_response_page2 = make_response([])
 
         # Set side_effect to return first page, then empty page
         mock_get.side_effect = [mock_response_page1, mock_response_page2]
 
-        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
         prs = client.fetch_merged_prs("2024-10-01", "2024-10-31")
 
         assert len(prs) == 1
         assert prs[0]["number"] == 1
         assert prs[0]["title"] == "Test PR"
 
-    @patch("impactlens.clients.github_client.requests.get")
-    def test_fetch_merged_prs_http_error(self, mock_get):
-        """Test fetching PRs with HTTP error."""
-        mock_response = Mock()
-        mock_response.raise_for_status.side_effect = Exception("HTTP Error")
+    @patch("requests.Session.get")
+    def test_fetch_merged_prs_stops_when_page_has_no_matches(self, mock_get, client, make_response):
+        """Test that pagination stops on an old page even if none of its PRs matched."""
+        mock_response = make_response(
+            [
+                {
+                    "number": 2,
+                    "title": "Other author PR",
+                    "user": {"login": "someone-else"},
+                    "merged_at": "2024-09-15T10:00:00Z",
+                    "created_at": "2024-09-14T10:00:00Z",
+                    "updated_at": "2024-09-15T10:00:00Z",
+                }
+            ]
+        )
         mock_get.return_value = mock_response
 
-        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
+        prs = client.fetch_merged_prs("2024-10-01", "2024-10-31", author="testuser")
+
+        assert prs == []
+        assert mock_get.call_count == 1
+
+    @patch("requests.Session.get")
+    def test_fetch_merged_prs_http_error(self, mock_get, client, make_response):
+        """Test fetching PRs with HTTP error."""
+        mock_response = make_response(raises=Exception("HTTP Error"))
+        mock_get.return_value = mock_response
 
         with pytest.raises(Exception, match="HTTP Error"):
             client.fetch_merged_prs("2024-10-01", "2024-10-31")
 
-    @patch("impactlens.clients.github_client.requests.get")
-    def test_get_pr_commits(self, mock_get):
+    @patch("requests.Session.get")
+    def test_get_pr_commits(self, mock_get, client, make_response):
         """Test getting PR commits."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {"sha": "abc123", "commit": {"message": "Fix bug\n\nAssisted-by: Claude"}}
-        ]
+        mock_response = make_response(
+            [{"sha": "abc123", "commit": {"message": "Fix bug\n\nAssisted-by: Claude"}}]
+        )
         mock_get.return_value = mock_response
 
-        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
         commits = client.get_pr_commits(1)
 
         assert len(commits) == 1
         assert commits[0]["sha"] == "abc123"
 
-    @patch("impactlens.clients.github_client.requests.get")
-    def test_get_pr_reviews(self, mock_get):
+    @patch("requests.Session.get")
+    def test_get_pr_reviews(self, mock_get, client, make_response):
         """Test getting PR reviews."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
-            {
-                "id": 1,
-                "user": {"login": "reviewer"},
-                "state": "APPROVED",
-                "submitted_at": "2024-10-15T12:00:00Z",
-            }
-        ]
+        mock_response = make_response(
+            [
+                {
+                    "id": 1,
+                    "user": {"login": "reviewer"},
+                    "state": "APPROVED",
+                    "submitted_at": "2024-10-15T12:00:00Z",
+                }
+            ]
+        )
         mock_get.return_value = mock_response
 
-        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
         reviews = client.get_pr_reviews(1)
 
         assert len(reviews) == 1
         assert reviews[0]["state"] == "APPROVED"
 
-    @patch("impactlens.clients.github_client.requests.get")
-    def test_get_pr_comments(self, mock_get):
+    @patch("requests.Session.get")
+    def test_get_pr_comments(self, mock_get, client, make_response):
         """Test getting PR comments."""
         # Mock review comments
-        mock_review_response = Mock()
-        mock_review_response.status_code = 200
-        mock_review_response.json.return_value = [
-            {"id": 1, "body": "Review comment", "user": {"login": "reviewer"}}
-        ]
+        mock_review_response = make_response(
+            [{"id": 1, "body": "Review comment", "user": {"login": "reviewer"}}]
+        )
 
         # Mock issue comments
-        mock_issue_response = Mock()
-        mock_issue_response.status_code = 200
-        mock_issue_response.json.return_value = [
-            {"id": 2, "body": "Issue comment", "user": {"login": "commenter"}}
-        ]
+        mock_issue_response = make_response(
+            [{"id": 2, "body": "Issue comment", "user": {"login": "commenter"}}]
+        )
 
         # Mock reviews (for identifying approval-only comments)
-        mock_reviews_response = Mock()
-        mock_reviews_response.status_code = 200
-        mock_reviews_response.json.return_value = [{"id": 3, "state": "APPROVED", "body": "LGTM"}]
+        mock_reviews_response = make_response([{"id": 3, "state": "APPROVED", "body": "LGTM"}])
 
         # get_pr_comments makes 3 API calls: review comments, issue comments, reviews
-        mock_get.side_effect = [mock_review_response, mock_issue_response, mock_reviews_response]
+        responses = {
+            "/pulls/1/comments": mock_review_response,
+            "/issues/1/comments": mock_issue_response,
+            "/pulls/1/reviews": mock_reviews_response,
+        }
+        mock_get.side_effect = lambda url, **kwargs: next(
+            response for suffix, response in responses.items() if url.endswith(suffix)
+        )
 
-        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
         comments = client.get_pr_comments(1)
 
         assert comments["total_comments"] == 2
         assert len(comments["review_comments"]) == 1
         assert len(comments["issue_comments"]) == 1
         assert len(comments["approval_review_ids"]) == 1
+        assert mock_get.call_count == 3
 
     @patch.object(GitHubClient, "get_pr_commits")
-    def test_detect_ai_assistance_claude(self, mock_get_commits):
+    def test_detect_ai_assistance_claude(self, mock_get_commits, client):
         """Test detecting Claude AI assistance."""
         mock_get_commits.return_value = [
             {
@@ -168,7 +187,6 @@ class TestGitHubClient:
             }
         ]
 
-        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
         result = client.detect_ai_assistance(1)
 
         assert result["has_ai_assistance"] is True
@@ -177,27 +195,25 @@ class TestGitHubClient:
         assert result["total_commits"] == 1
 
     @patch.object(GitHubClient, "get_pr_commits")
-    def test_detect_ai_assistance_cursor(self, mock_get_commits):
+    def test_detect_ai_assistance_cursor(self, mock_get_commits, client):
         """Test detecting Cursor AI assistance."""
         mock_get_commits.return_value = [
             {"commit": {"message": "Implement feature\n\nAssisted-by: Cursor"}}
         ]
 
-        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
         result = client.detect_ai_assistance(1)
 
         assert result["has_ai_assistance"] is True
         assert "Cursor" in result["ai_tools"]
 
     @patch.object(GitHubClient, "get_pr_commits")
-    def test_detect_ai_assistance_both_tools(self, mock_get_commits):
+    def test_detect_ai_assistance_both_tools(self, mock_get_commits, client):
         """Test detecting both Claude and Cursor."""
         mock_get_commits.return_value = [
             {"commit": {"message": "First commit\n\nAssisted-by: Claude"}},
             {"commit": {"message": "Second commit\n\nAssisted-by: Cursor"}},
         ]
 
-        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
         result = client.detect_ai_assistance(1)
 
         assert result["has_ai_assistance"] is True
@@ -206,11 +222,10 @@ class TestGitHubClient:
         assert result["ai_commits_count"] == 2
 
     @patch.object(GitHubClient, "get_pr_commits")
-    def test_detect_ai_assistance_none(self, mock_get_commits):
+    def test_detect_ai_assistance_none(self, mock_get_commits, client):
         """Test detecting no AI assistance."""
         mock_get_commits.return_value = [{"commit": {"message": "Regular commit without AI"}}]
 
-        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
         result = client.detect_ai_assistance(1)
 
         assert result["has_ai_assistance"] is False
@@ -218,11 +233,10 @@ class TestGitHubClient:
         assert result["ai_commits_count"] == 0
 
     @patch.object(GitHubClient, "get_pr_commits")
-    def test_detect_ai_assistance_case_insensitive(self, mock_get_commits):
+    def test_detect_ai_assistance_case_insensitive(self, mock_get_commits, client):
         """Test AI detection is case insensitive."""
         mock_get_commits.return_value = [{"commit": {"message": "Fix bug\n\nassisted-by: claude"}}]
 
-        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
         result = client.detect_ai_assistance(1)
 
         assert result["has_ai_assistance"] is True
@@ -232,7 +246,9 @@ class TestGitHubClient:
     @patch.object(GitHubClient, "get_pr_reviews")
     @patch.object(GitHubClient, "get_pr_comments")
     @patch.object(GitHubClient, "get_pr_details")
-    def test_get_pr_detailed_metrics(self, mock_pr_details, mock_comments, mock_reviews, mock_ai):
+    def test_get_pr_detailed_metrics(
+        self, mock_pr_details, mock_comments, mock_reviews, mock_ai, client
+    ):
         """Test getting detailed PR metrics."""
         # Mock AI detection
         mock_ai.return_value = {
@@ -290,7 +306,6 @@ class TestGitHubClient:
             "changed_files": 0,  # List endpoint may not have this
         }
 
-        client = GitHubClient(token="token", repo_owner="owner", repo_name="repo")
         metrics = client.get_pr_detailed_metrics(pr_data)
 
         assert metrics["pr_number"] == 1
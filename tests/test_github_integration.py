@@ -13,6 +13,7 @@ Or with tox: tox -e github-integration
 
 import os
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from impactlens.clients.github_client import GitHubClient
@@ -26,6 +27,29 @@ pytestmark = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(scope="module")
+def client():
+    """GitHubClient shared by the module's tests."""
+    return GitHubClient()
+
+
+@pytest.fixture(scope="module")
+def today():
+    """Reference date shared by the module's date windows."""
+    return datetime.now()
+
+
+def date_window(today, days):
+    """Return (start_date, end_date) strings for the last `days` days."""
+    return (today - timedelta(days=days)).strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+
+
+@pytest.fixture(scope="module")
+def recent_prs(client, today):
+    """Merged PRs from the last 90 days, fetched once for the module."""
+    return client.fetch_merged_prs(*date_window(today, 90))
+
+
 class TestGitHubIntegration:
     """Integration tests with real GitHub API."""
 
@@ -37,13 +61,10 @@ class TestGitHubIntegration:
         assert client.repo_name is not None
         print(f"\n✓ Connected to {client.repo_owner}/{client.repo_name}")
 
-    def test_fetch_recent_merged_prs(self):
+    def test_fetch_recent_merged_prs(self, client, today):
         """Test fetching recent merged PRs."""
-        client = GitHubClient()
-
         # Fetch PRs from last 30 days
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+        start_date, end_date = date_window(today, 30)
 
         print(f"\n📥 Fetching PRs from {start_date} to {end_date}")
 
@@ -58,15 +79,9 @@ class TestGitHubIntegration:
             print(f"  Author: {pr['user']['login']}")
             print(f"  Merged: {pr['merged_at']}")
 
-    def test_pr_detailed_metrics(self):
+    def test_pr_detailed_metrics(self, client, recent_prs):
         """Test getting detailed metrics for a PR."""
-        client = GitHubClient()
-
-        # Fetch recent PRs
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
-
-        prs = client.fetch_merged_prs(start_date, end_date)
+        prs = recent_prs
 
         if not prs:
             pytest.skip("No recent merged PRs found for testing")
@@ -95,24 +110,24 @@ class TestGitHubIntegration:
         print(f"  Comments: {metrics['total_comments_count']}")
         print(f"  Changes requested: {metrics['changes_requested_count']}")
 
-    def test_ai_detection(self):
+    def test_ai_detection(self, client, recent_prs):
         """Test AI assistance detection in commit messages."""
-        client = GitHubClient()
-
-        # Fetch recent PRs
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
-
-        prs = client.fetch_merged_prs(start_date, end_date)
+        prs = recent_prs
 
         if not prs:
             pytest.skip("No recent merged PRs found for testing")
 
         print("\n🔍 Scanning PRs for AI assistance...")
 
+        # Check first 10 PRs, fetching their commits concurrently
+        checked_prs = prs[:10]
+        with ThreadPoolExecutor(max_workers=len(checked_prs)) as executor:
+            ai_infos = list(
+                executor.map(client.detect_ai_assistance, [pr["number"] for pr in checked_prs])
+            )
+
         ai_assisted_count = 0
-        for pr in prs[:10]:  # Check first 10 PRs
-            ai_info = client.detect_ai_assistance(pr["number"])
+        for pr, ai_info in zip(checked_prs, ai_infos):
             if ai_info["has_ai_assistance"]:
                 ai_assisted_count += 1
                 print(
@@ -1,8 +1,15 @@
 """Tests for Jira client."""
 
+import pytest
 import requests
-from unittest.mock import Mock, patch
-from impactlens.clients.jira_client import JiraClient
+from unittest.mock import patch
+from impactlens.clients.jira_client import DEFAULT_FIELDS, JiraClient
+
+
+@pytest.fixture
+def client():
+    """JiraClient for the mocked Jira server (a fresh one per test)."""
+    return JiraClient(jira_url="https://test.jira.com", api_token="test-token")
 
 
 class TestJiraClient:
@@ -34,63 +41,161 @@ class TestJiraClient:
         assert client.api_token == "custom-token"
         assert client.email == "user@example.com"
 
-    @patch("impactlens.clients.jira_client.requests.post")
-    def test_fetch_jira_data_success(self, mock_post):
+    @patch("impactlens.clients.jira_client.requests.Session.post")
+    def test_fetch_jira_data_success(self, mock_post, client, make_response):
         """Test successful Jira data fetch."""
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"total": 10, "issues": []}
+        mock_response = make_response({"total": 10, "issues": []})
         mock_post.return_value = mock_response
 
-        client = JiraClient(jira_url="https://test.jira.com", api_token="test-token")
         result = client.fetch_jira_data('project = "TEST"')
 
         assert result is not None
         assert result["total"] == 10
         mock_post.assert_called_once()
 
-    @patch("impactlens.clients.jira_client.requests.post")
-    def test_fetch_jira_data_error(self, mock_post):
+    @patch("impactlens.clients.jira_client.requests.Session.post")
+    def test_fetch_jira_data_error(self, mock_post, client, make_response):
         """Test Jira data fetch with error."""
-        mock_response = Mock()
-        mock_response.ok = False
-        mock_response.status_code = 403
-        mock_response.text = "Forbidden"
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("HTTP Error")
+        mock_response = make_response(
+            status=403, raises=requests.exceptions.HTTPError("HTTP Error"), text="Forbidden"
+        )
         mock_post.return_value = mock_response
 
-        client = JiraClient(jira_url="https://test.jira.com", api_token="test-token")
         result = client.fetch_jira_data('project = "TEST"')
 
         assert result is None
 
-    @patch("impactlens.clients.jira_client.requests.post")
-    def test_fetch_all_issues(self, mock_post):
+    @patch("impactlens.clients.jira_client.requests.Session.post")
+    def test_fetch_all_issues(self, mock_post, client, make_response):
         """Test fetching all issues with token-based pagination."""
         # First page with nextPageToken
-        mock_response1 = Mock()
-        mock_response1.ok = True
-        mock_response1.status_code = 200
-        mock_response1.json.return_value = {
-            "issues": [{"key": "TEST-1"}],
-            "nextPageToken": "token123",
-        }
+        mock_response1 = make_response(
+            {
+                "issues": [{"key": "TEST-1"}],
+                "nextPageToken": "token123",
+            }
+        )
 
         # Second page without nextPageToken (last page)
-        mock_response2 = Mock()
-        mock_response2.ok = True
-        mock_response2.status_code = 200
-        mock_response2.json.return_value = {
-            "issues": [{"key": "TEST-2"}],
-        }
+        mock_response2 = make_response(
+            {
+                "issues": [{"key": "TEST-2"}],
+            }
+        )
 
         mock_post.side_effect = [mock_response1, mock_response2]
 
-        client = JiraClient(jira_url="https://test.jira.com", api_token="test-token")
         result = client.fetch_all_issues('project = "TEST"', batch_size=50)
 
         assert len(result) == 2
         assert result[0]["key"] == "TEST-1"
         assert result[1]["key"] == "TEST-2"
         assert mock_post.call_count == 2
+
+    @patch("impactlens.clients.jira_client.requests.Session.post")
+    def test_fetch_all_issues_follows_server_page_cap(self, mock_post, client, make_response):
+        """Test that a page capped by the server lowers the size of later requests."""
+        mock_response1 = make_response(
+            {
+                "issues": [{"key": "TEST-1"}, {"key": "TEST-2"}],
+                "nextPageToken": "token123",
+            }
+        )
+
+        mock_response2 = make_response({"issues": [{"key": "TEST-3"}]})
+
+        mock_post.side_effect = [mock_response1, mock_response2]
+
+        result = client.fetch_all_issues('project = "TEST"')
+
+        assert [issue["key"] for issue in result] == ["TEST-1", "TEST-2", "TEST-3"]
+        assert mock_post.call_args_list[0].kwargs["json"]["maxResults"] == 1000
+        assert mock_post.call_args_list[1].kwargs["json"]["maxResults"] == 2
+
+    @patch("impactlens.clients.jira_client.requests.Session.post")
+    def test_fetch_all_issues_stops_on_is_last(self, mock_post, client, make_response):
+        """Test that pagination stops when Jira marks a page as the last one."""
+        mock_response1 = make_response(
+            {
+                "issues": [{"key": "TEST-1"}],
+                "nextPageToken": "token123",
+                "isLast": False,
+            }
+        )
+
+        mock_response2 = make_response(
+            {
+                "issues": [{"key": "TEST-2"}],
+                "nextPageToken": "token456",
+                "isLast": True,
+            }
+        )
+
+        mock_post.side_effect = [mock_response1, mock_response2]
+
+        result = client.fetch_all_issues('project = "TEST"', batch_size=1)
+
+        assert [issue["key"] for issue in result] == ["TEST-1", "TEST-2"]
+        assert mock_post.call_count == 2
+        assert mock_post.call_args_list[1].kwargs["json"]["nextPageToken"] == "token123"
+
+    @patch("impactlens.clients.jira_client.requests.Session.post")
+    def test_fetch_jira_data_fields(self, mock_post, client, make_response):
+        """Test that only the requested issue fields are asked for."""
+        mock_response = make_response({"issues": []})
+        mock_post.return_value = mock_response
+
+        client.fetch_jira_data('project = "TEST"')
+        client.fetch_jira_data('project = "TEST"', fields=["customfield_1"])
+
+        assert mock_post.call_args_list[0].kwargs["json"]["fields"] == list(DEFAULT_FIELDS)
+        assert mock_post.call_args_list[1].kwargs["json"]["fields"] == ["customfield_1"]
+
+    @patch("impactlens.clients.jira_client.requests.Session.post")
+    def test_iter_all_issues_fetches_pages_lazily(self, mock_post, client, make_response):
+        """Test that the next page is only requested once the current one is consumed."""
+        mock_response1 = make_response(
+            {
+                "issues": [{"key": "TEST-1"}],
+                "nextPageToken": "token123",
+            }
+        )
+
+        mock_response2 = make_response({"issues": [{"key": "TEST-2"}]})
+
+        mock_post.side_effect = [mock_response1, mock_response2]
+
+        issues = client.iter_all_issues('project = "TEST"', batch_size=1)
+
+        assert next(issues)["key"] == "TEST-1"
+        assert mock_post.call_count == 1
+        assert [issue["key"] for issue in issues] == ["TEST-2"]
+        assert mock_post.call_count == 2
+
+    @patch("impactlens.clients.jira_client.requests.Session.post")
+    def test_fetch_jira_data_uses_response_cache(self, mock_post, tmp_path, make_response):
+        """Test that identical searches within the TTL are answered from the disk cache."""
+        mock_response = make_response({"issues": [{"key": "TEST-1"}]})
+        mock_post.return_value = mock_response
+
+        cached_client = JiraClient(
+            jira_url="https://test.jira.com",
+            api_token="test-token",
+            cache_ttl=60,
+            cache_dir=tmp_path,
+        )
+        first = cached_client.fetch_jira_data('project = "TEST"')
+        second = cached_client.fetch_jira_data('project = "TEST"')
+        cached_client.fetch_jira_data('project = "OTHER"')
+
+        assert first == second == {"issues": [{"key": "TEST-1"}]}
+        assert mock_post.call_count == 2
+
+    @pytest.mark.parametrize(
+        "env_value, expected_ttl", [("", 0), ("  ", 0), ("120", 120), ("5m", 0), ("1.5", 0)]
+    )
+    def test_init_cache_ttl_from_env(self, env_value, expected_ttl):
+        """Test JIRA_CACHE_TTL parsing: empty or malformed values disable the cache."""
+        with patch.dict("os.environ", {"JIRA_CACHE_TTL": env_value}):
+            client = JiraClient(jira_url="https://test.jira.com", api_token="test-token")
+        assert client.cache_ttl == expected_ttl
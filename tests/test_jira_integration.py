@@ -15,18 +15,29 @@ from impactlens.clients.jira_client import JiraClient
 from impactlens.utils.core_utils import build_jql_query
 
 
+@pytest.fixture(scope="module")
+def client():
+    """JiraClient shared by the module, so all queries reuse one pooled connection."""
+    client = JiraClient()
+    yield client
+    client.session.close()
+
+
+@pytest.fixture(scope="module")
+def project_key():
+    """Project queried by the integration tests."""
+    return os.getenv("JIRA_PROJECT_KEY", "Konflux UI")
+
+
 @pytest.mark.skipif(
     not os.getenv("JIRA_API_TOKEN"), reason="JIRA_API_TOKEN not set - skipping integration tests"
 )
 class TestJiraIntegration:
     """Integration tests with real Jira instance."""
 
-    def test_jira_connection(self):
+    def test_jira_connection(self, client, project_key):
         """Test connection to Jira."""
-        client = JiraClient()
-
         # Simple query to test connection
-        project_key = os.getenv("JIRA_PROJECT_KEY", "Konflux UI")
         jql = f'project = "{project_key}"'
 
         result = client.fetch_jira_data(jql, max_results=1)
@@ -38,11 +49,8 @@ class TestJiraIntegration:
         print(f"  Project: {project_key}")
         print(f"  Total issues found: {result['total']}")
 
-    def test_fetch_with_date_filter(self):
+    def test_fetch_with_date_filter(self, client, project_key):
         """Test fetching issues with date filters."""
-        client = JiraClient()
-        project_key = os.getenv("JIRA_PROJECT_KEY", "Konflux UI")
-
         # Test with a recent date range
         jql = build_jql_query(
             project_key=project_key, start_date="2025-10-01", end_date="2025-10-20"
@@ -59,11 +67,8 @@ class TestJiraIntegration:
             issue = result["issues"][0]
             print(f"  Sample issue: {issue['key']}")
 
-    def test_fetch_with_assignee(self):
+    def test_fetch_with_assignee(self, client, project_key):
         """Test fetching issues for specific assignee."""
-        client = JiraClient()
-        project_key = os.getenv("JIRA_PROJECT_KEY", "Konflux UI")
-
         # Get current user's email from environment if available
         assignee = os.getenv("JIRA_USER_EMAIL")
 
@@ -79,11 +84,8 @@ class TestJiraIntegration:
         print(f"  Assignee: {assignee}")
         print(f"  Issues found: {result['total']}")
 
-    def test_fetch_all_issues_pagination(self):
+    def test_fetch_all_issues_pagination(self, client, project_key):
         """Test pagination with real data."""
-        client = JiraClient()
-        project_key = os.getenv("JIRA_PROJECT_KEY", "Konflux UI")
-
         # Use small batch size to test pagination
         jql = f'project = "{project_key}"'
         issues = client.fetch_all_issues(jql, batch_size=10, expand=None)
@@ -96,11 +98,8 @@ class TestJiraIntegration:
             print(f"  First issue: {issues[0]['key']}")
             print(f"  Last issue: {issues[-1]['key']}")
 
-    def test_changelog_expansion(self):
+    def test_changelog_expansion(self, client, project_key):
         """Test fetching issues with changelog expansion."""
-        client = JiraClient()
-        project_key = os.getenv("JIRA_PROJECT_KEY", "Konflux UI")
-
         jql = build_jql_query(
             project_key=project_key, start_date="2025-10-01", end_date="2025-10-20"
         )
@@ -0,0 +1,35 @@
+"""Tests for Jira metrics calculator."""
+
+from unittest.mock import patch
+from impactlens.core.jira_metrics_calculator import STORY_POINTS_FIELD, JiraMetricsCalculator
+
+
+class TestCalculateVelocity:
+    """Test story point velocity."""
+
+    @patch("impactlens.clients.jira_client.requests.Session.post")
+    def test_calculate_velocity_sums_story_points(self, mock_post, make_response):
+        """Test that story points are requested and summed across stories."""
+        mock_post.return_value = make_response(
+            {
+                "issues": [
+                    {"key": "TEST-1", "fields": {STORY_POINTS_FIELD: 3.0}},
+                    {"key": "TEST-2", "fields": {STORY_POINTS_FIELD: 5.0}},
+                    {"key": "TEST-3", "fields": {STORY_POINTS_FIELD: None}},
+                ],
+                "isLast": True,
+            }
+        )
+
+        calculator = JiraMetricsCalculator(
+            jira_url="https://test.jira.com", jira_token="test-token", project_key="TEST"
+        )
+        velocity = calculator.calculate_velocity("TEST")
+
+        assert mock_post.call_args.kwargs["json"]["fields"] == [STORY_POINTS_FIELD]
+        assert velocity == {
+            "total_stories": 3,
+            "stories_with_points": 2,
+            "total_story_points": 8.0,
+            "avg_points_per_story": 4.0,
+        }
@@ -1,12 +1,15 @@
 """Tests for utility functions."""
 
-from datetime import datetime
+import os
+from datetime import date, datetime, timedelta
 from impactlens.utils.core_utils import (
     convert_date_to_jql,
     parse_datetime,
     build_jql_query,
     calculate_state_durations,
 )
+from impactlens.utils.visualization import _index_sections, read_combined_report
+from impactlens.utils.workflow_utils import read_yaml_config
 
 
 class TestConvertDateToJQL:
@@ -29,6 +32,14 @@ class TestConvertDateToJQL:
         result = convert_date_to_jql(None)
         assert result is None
 
+    def test_convert_date_objects(self):
+        """Test date and datetime inputs skip string parsing."""
+        today = date.today()
+        assert convert_date_to_jql(today) == "startOfDay()"
+        assert convert_date_to_jql(datetime.now()) == "startOfDay()"
+        assert convert_date_to_jql(today - timedelta(days=3)) == '"-3d"'
+        assert convert_date_to_jql(today + timedelta(days=2)) == '"2d"'
+
 
 class TestParseDatetime:
     """Test datetime parsing."""
@@ -54,6 +65,17 @@ class TestParseDatetime:
         result = parse_datetime("invalid")
         assert result is None
 
+    def test_parse_datetime_keeps_offset(self):
+        """Test Jira's compact offset is preserved."""
+        result = parse_datetime("2024-01-15T10:30:45.123-0500")
+        assert result.utcoffset().total_seconds() == -5 * 3600
+        assert result.microsecond == 123000
+
+    def test_parse_datetime_rejects_naive(self):
+        """Test timestamps without an offset are rejected."""
+        assert parse_datetime("2024-01-15T10:30:45") is None
+        assert parse_datetime("2024-01-15") is None
+
 
 class TestBuildJQLQuery:
     """Test JQL query building."""
@@ -134,3 +156,96 @@ class TestCalculateStateDurations:
         issue = {"key": "TEST-123", "fields": {"status": {"name": "Done"}}}
         result = calculate_state_durations(issue)
         assert result == {}
+
+
+class TestReadYaml:
+    """Test cached YAML config loading."""
+
+    def test_read_yaml_reuses_parse_while_unchanged(self, tmp_path):
+        """Test repeated reads of an unchanged file hit the cache."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("members:\n  - name: alice\n")
+
+        first = read_yaml_config(config_path)
+        assert first == {"members": [{"name": "alice"}]}
+        assert read_yaml_config(config_path) is first
+
+    def test_read_yaml_reparses_on_mtime_change(self, tmp_path):
+        """Test a same-size rewrite with a new mtime is reparsed."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("name: alice\n")
+        assert read_yaml_config(config_path) == {"name": "alice"}
+
+        mtime_ns = config_path.stat().st_mtime_ns
+        config_path.write_text("name: carol\n")
+        os.utime(config_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+        assert read_yaml_config(config_path) == {"name": "carol"}
+
+    def test_read_yaml_reparses_on_size_change(self, tmp_path):
+        """Test a rewrite within the same mtime is caught by the size."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("name: bob\n")
+        assert read_yaml_config(config_path) == {"name": "bob"}
+
+        mtime_ns = config_path.stat().st_mtime_ns
+        config_path.write_text("name: robert\n")
+        os.utime(config_path, ns=(mtime_ns, mtime_ns))
+
+        assert read_yaml_config(config_path) == {"name": "robert"}
+
+
+class TestReadCombinedReport:
+    """Test cached combined report reading and section indexing."""
+
+    REPORT = (
+        "Project: Demo\n"
+        "\n"
+        "=== Daily Throughput ===\n"
+        "Phase\tteam\tDeveloper-1\n"
+        "Phase 1\t1.5/d\t2.0/d\n"
+        "\n"
+        "  === Bug Percentage ===\n"
+        "Phase\tteam\tDeveloper-1\n"
+        "=== Daily Throughput ===\n"
+        "Phase\tteam\n"
+        "=== Average Closure Time ===\n"
+        "Phase\tteam\tDeveloper-1\n"
+        "Phase 1\t3d\tN/A"
+    )
+
+    def test_read_combined_report_indexes_sections(self, tmp_path):
+        """Test the cached index matches a fresh scan of the returned lines."""
+        report_path = tmp_path / "combined_jira_report.tsv"
+        report_path.write_text(self.REPORT)
+
+        lines, section_index = read_combined_report(str(report_path))
+
+        assert "".join(lines) == self.REPORT
+        assert section_index == _index_sections(lines)
+        assert section_index == {
+            "Daily Throughput": (2, 6),
+            "Bug Percentage": (6, 8),
+            "Average Closure Time": (10, 13),
+        }
+
+    def test_read_combined_report_empty_file(self, tmp_path):
+        """Test an empty report yields no lines and no sections."""
+        report_path = tmp_path / "empty.tsv"
+        report_path.write_text("")
+
+        assert read_combined_report(str(report_path)) == ((), {})
+
+    def test_read_combined_report_rereads_on_size_change(self, tmp_path):
+        """Test the cache is reused while unchanged and invalidated by a rewrite."""
+        report_path = tmp_path / "combined_pr_report.tsv"
+        report_path.write_text("=== A ===\n")
+
+        first = read_combined_report(str(report_path))
+        assert read_combined_report(str(report_path)) is first
+
+        mtime_ns = report_path.stat().st_mtime_ns
+        report_path.write_text("=== A ===\n=== B ===\n")
+        os.utime(report_path, ns=(mtime_ns, mtime_ns))
+
+        assert read_combined_report(str(report_path))[1] == {"A": (0, 1), "B": (1, 2)}